@@ -0,0 +1,6 @@
+"""Allow running the CLI as ``python -m services.cli``."""
+
+from services.cli.main import main
+
+if __name__ == "__main__":
+    main()
@@ -31,8 +31,14 @@ class CodeContext:
 class Analyzer:
     """Analyzes source code to extract structural context."""
 
-    def __init__(self, root_dir: Path, ignore_patterns: list[str] | None = None):
+    def __init__(
+        self,
+        root_dir: Path,
+        ignore_patterns: list[str] | None = None,
+        exclude_paths: list[Path] | None = None,
+    ):
         self.root_dir = root_dir.resolve()
+        self.exclude_paths = {path.resolve() for path in exclude_paths or []}
         self.ignore_patterns = ignore_patterns or [
             "node_modules",
             "__pycache__",
@@ -96,7 +102,11 @@ class Analyzer:
         }
         for root, dirs, files in os.walk(self.root_dir):
             # Prune ignored directories
-            dirs[:] = [d for d in dirs if d not in self.ignore_patterns]
+            dirs[:] = [
+                d
+                for d in dirs
+                if d not in self.ignore_patterns and Path(root, d) not in self.exclude_paths
+            ]
 
             rel_path = Path(root).relative_to(self.root_dir)
             if rel_path == Path("."):
@@ -109,6 +119,8 @@ class Analyzer:
                 continue
 
             for f in files:
+                if self.exclude_paths and Path(root, f) in self.exclude_paths:
+                    continue
                 rel = str(rel_path / f)
                 suffix = Path(f).suffix.lower()
                 if suffix in allowed_suffixes or f in marker_files:
@@ -12,6 +12,39 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# What each generated document should cover.
+DOC_FOCUS = {
+    "README.md": "Overview, setup, usage instructions, and value proposition.",
+    "ARCHITECTURE.md": "System design, component relationships, data flow, and technology choices.",
+    "API.md": "Detailed API documentation, endpoints, data models, and authentication.",
+}
+
+PROMPT_TEMPLATE = """You are a professional Technical Writer and Software Architect.
+Your task is to generate {doc_type} for the project '{project_name}'.
+
+The documentation should focus on: {focus}
+
+Project Context:
+- Tech Stack: {tech_stack}
+- File Structure (top 50 files):
+{tree_str}
+
+Key Source Code Insight (Classes, Functions, Docstrings):
+{symbols_str}
+
+Instructions:
+1. Write in clear, professional technical English.
+2. Use GitHub Flavored Markdown (GFM).
+3. Be specific and derive as much information as possible from
+   the file structure and key symbols provided.
+4. If the structure suggests a specific framework
+   (e.g. Next.js, FastAPI, AWS Lambda), tailor the docs accordingly.
+5. Do not hallucinate features not hinted at in the code,
+   but you can suggest standard best practices for the detected stack.
+
+Response should be ONLY the Markdown content for the file.
+"""
+
 
 class DocGenerator:
     """Generates Markdown documentation from project context using LLMs."""
@@ -24,7 +57,7 @@ class DocGenerator:
         prompt = self._build_prompt(
             ctx,
             doc_type="README.md",
-            focus="Overview, setup, usage instructions, and value proposition.",
+            focus=DOC_FOCUS["README.md"],
         )
         return self.llm_provider.generate(prompt)
 
@@ -33,7 +66,7 @@ class DocGenerator:
         prompt = self._build_prompt(
             ctx,
             doc_type="ARCHITECTURE.md",
-            focus="System design, component relationships, data flow, and technology choices.",
+            focus=DOC_FOCUS["ARCHITECTURE.md"],
         )
         return self.llm_provider.generate(prompt)
 
@@ -42,7 +75,7 @@ class DocGenerator:
         prompt = self._build_prompt(
             ctx,
             doc_type="API.md",
-            focus="Detailed API documentation, endpoints, data models, and authentication.",
+            focus=DOC_FOCUS["API.md"],
         )
         return self.llm_provider.generate(prompt)
 
@@ -65,28 +98,11 @@ class DocGenerator:
                 for func in data["functions"]:
                     symbols_str += f"Function: {func['name']}\n"
 
-        return f"""You are a professional Technical Writer and Software Architect.
-Your task is to generate {doc_type} for the project '{ctx.project_name}'.
-
-The documentation should focus on: {focus}
-
-Project Context:
-- Tech Stack: {', '.join(ctx.tech_stack)}
-- File Structure (top 50 files):
-{tree_str}
-
-Key Source Code Insight (Classes, Functions, Docstrings):
-{symbols_str}
-
-Instructions:
-1. Write in clear, professional technical English.
-2. Use GitHub Flavored Markdown (GFM).
-3. Be specific and derive as much information as possible from
-   the file structure and key symbols provided.
-4. If the structure suggests a specific framework
-   (e.g. Next.js, FastAPI, AWS Lambda), tailor the docs accordingly.
-5. Do not hallucinate features not hinted at in the code,
-   but you can suggest standard best practices for the detected stack.
-
-Response should be ONLY the Markdown content for the file.
-"""
+        return PROMPT_TEMPLATE.format(
+            doc_type=doc_type,
+            project_name=ctx.project_name,
+            focus=focus,
+            tech_stack=", ".join(ctx.tech_stack),
+            tree_str=tree_str,
+            symbols_str=symbols_str,
+        )
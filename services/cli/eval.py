@@ -40,7 +40,7 @@ def load_eval_cases(dataset_path: Path, default_collection: str) -> list[EvalCas
     """Load eval cases from JSON/YAML."""
     raw = dataset_path.read_text(encoding="utf-8")
     if dataset_path.suffix.lower() in {".yaml", ".yml"}:
-        data = yaml.safe_load(raw)
+        data = yaml.load(raw, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
     else:
         data = json.loads(raw)
 
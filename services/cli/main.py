@@ -4,38 +4,111 @@ from __future__ import annotations
 
 import argparse
 import getpass
-import importlib.metadata
+import json
 import os
+import re
 import subprocess
 import sys
-from dataclasses import dataclass
+import tempfile
+import time
+from collections.abc import Callable
+from contextlib import AbstractContextManager, nullcontext
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from rich.console import Console
-from rich.markdown import Markdown
-from rich.panel import Panel
-from rich.table import Table
+if TYPE_CHECKING:
+    from rich.console import Console, Group
+    from rich.markdown import Markdown
+    from rich.text import Text
 
-console = Console()
+try:
+    import orjson
+except ImportError:  # optional: pip install "ragops[fast]"
+    orjson = None  # type: ignore[assignment]
 
 
-def _read_env_value(env_path: Path, key: str) -> str:
-    """Read simple KEY=VALUE pair from .env file."""
+class _LazyConsole:
+    """Stand-in for the shared Rich console; Rich is only imported on first use."""
+
+    _console: Console | None = None
+
+    def __getattr__(self, name: str) -> object:
+        if self._console is None:
+            from rich.console import Console
+
+            self._console = Console()
+        return getattr(self._console, name)
+
+
+console = _LazyConsole()
+
+
+def _status(message: str) -> AbstractContextManager[object]:
+    """Show a spinner while the block runs, or nothing when output is not a terminal."""
+    # Rich starts a refresh thread even when piped, where nothing would be drawn.
+    if not console.is_terminal:
+        return nullcontext()
+    return console.status(message, spinner="dots")
+
+
+def _read_env_values(env_path: Path) -> dict[str, str]:
+    """Read all simple KEY=VALUE pairs from .env file (first occurrence wins)."""
     if not env_path.exists():
-        return ""
+        return {}
+    values: dict[str, str] = {}
     for raw in env_path.read_text(encoding="utf-8").splitlines():
         line = raw.strip()
         if not line or line.startswith("#") or "=" not in line:
             continue
         current_key, value = line.split("=", 1)
-        if current_key.strip() == key:
-            return value.strip()
-    return ""
+        values.setdefault(current_key.strip(), value.strip())
+    return values
+
+
+def _read_env_value(env_path: Path, key: str) -> str:
+    """Read simple KEY=VALUE pair from .env file."""
+    return _read_env_values(env_path).get(key, "")
+
+
+def _json_bytes(payload: object) -> bytes:
+    """Serialize payload to indented UTF-8 JSON bytes, via orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(payload, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _json_loads(raw: str) -> object:
+    """Parse a JSON document, via orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _print_json(payload: object) -> None:
+    """Write payload to stdout as indented JSON without a str round trip."""
+    _print_json_bytes(_json_bytes(payload))
+
+
+def _print_json_bytes(encoded: bytes) -> None:
+    """Write already-serialized JSON bytes to stdout, newline-terminated."""
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        sys.stdout.write(encoded.decode("utf-8"))
+        sys.stdout.write("\n")
+        return
+    sys.stdout.flush()
+    # Separate writes: appending the newline to a large report would copy all of it.
+    buffer.write(encoded)
+    buffer.write(b"\n")
+    buffer.flush()
 
 
 def _upsert_env_values(env_path: Path, updates: dict[str, str]) -> None:
     """Upsert env vars while preserving unrelated lines."""
+    from services.cli.project import atomic_write_text
+
     lines = env_path.read_text(encoding="utf-8").splitlines() if env_path.exists() else []
     index_by_key: dict[str, int] = {}
     for idx, raw in enumerate(lines):
@@ -53,8 +126,13 @@ def _upsert_env_values(env_path: Path, updates: dict[str, str]) -> None:
         else:
             lines.append(rendered)
 
-    env_path.parent.mkdir(parents=True, exist_ok=True)
-    env_path.write_text("\n".join(lines).rstrip() + "\n", encoding="utf-8")
+    # Atomic, and a symlinked .env stays a symlink with its target's mode intact.
+    atomic_write_text(env_path, "\n".join(lines).rstrip() + "\n")
+
+    from services.core.config import get_settings
+
+    # Settings are cached per process; later reads must see the values just written.
+    get_settings.cache_clear()
 
 
 def _apply_user_profile_defaults() -> None:
@@ -148,6 +226,10 @@ def _git_changed_paths(root: Path, *, base_ref: str = "HEAD") -> tuple[set[str],
 
 def cmd_init(args: argparse.Namespace) -> None:
     """Initialize ragops in the current project."""
+    from rich.console import Group
+    from rich.panel import Panel
+    from rich.text import Text
+
     from services.cli.project import (
         ProjectConfig,
         detect_project_name,
@@ -217,24 +299,27 @@ def cmd_init(args: argparse.Namespace) -> None:
     )
     key_status = "set" if bool(openai_key) else "not set"
 
-    console.print()
+    blank = Text()
     console.print(
-        Panel(
-            f"[bold green]✅ Initialized ragops[/bold green]\n\n"
-            f"[cyan]Project:[/cyan] {name}\n"
-            f"[cyan]Config:[/cyan] {config_path.relative_to(project_dir)}\n\n"
-            f"[cyan]Env:[/cyan] {env_path.relative_to(project_dir)}\n"
-            f"[cyan]Global config:[/cyan] {user_cfg_path} ({profile_action})\n"
-            f"[cyan]Storage:[/cyan] {resolved_backend}\n"
-            f"[cyan]OPENAI_API_KEY:[/cyan] {key_status}\n\n"
-            f"[dim]Next steps:[/dim]\n"
-            f"  ragops scan     — index this project (plus manuals)\n"
-            f"  ragops chat     — ask questions (interactive if no question)",
-            title="📦 ragops init",
-            border_style="green",
+        Group(
+            blank,
+            Panel(
+                f"[bold green]✅ Initialized ragops[/bold green]\n\n"
+                f"[cyan]Project:[/cyan] {name}\n"
+                f"[cyan]Config:[/cyan] {config_path.relative_to(project_dir)}\n\n"
+                f"[cyan]Env:[/cyan] {env_path.relative_to(project_dir)}\n"
+                f"[cyan]Global config:[/cyan] {user_cfg_path} ({profile_action})\n"
+                f"[cyan]Storage:[/cyan] {resolved_backend}\n"
+                f"[cyan]OPENAI_API_KEY:[/cyan] {key_status}\n\n"
+                f"[dim]Next steps:[/dim]\n"
+                f"  ragops scan     — index this project (plus manuals)\n"
+                f"  ragops chat     — ask questions (interactive if no question)",
+                title="📦 ragops init",
+                border_style="green",
+            ),
+            blank,
         )
     )
-    console.print()
 
 
 # ---------------------------------------------------------------------------
@@ -244,6 +329,10 @@ def cmd_init(args: argparse.Namespace) -> None:
 
 def cmd_ingest(args: argparse.Namespace) -> None:
     """Ingest documents and code into the vector database."""
+    from rich.console import Group
+    from rich.panel import Panel
+    from rich.text import Text
+
     from services.cli.project import find_project_root, load_config
     from services.core.config import get_settings
     from services.core.logging import setup_logging
@@ -267,10 +356,13 @@ def cmd_ingest(args: argparse.Namespace) -> None:
     else:
         # Use config doc_dirs + code_dirs, resolved from project root
         dirs_to_ingest = []
+        seen: set[str] = set()
         for d in config.doc_dirs + config.code_dirs:
             full = root / d
-            if full.exists() and str(full) not in [str(x) for x in dirs_to_ingest]:
-                dirs_to_ingest.append(str(full))
+            key = str(full)
+            if key not in seen and full.exists():
+                seen.add(key)
+                dirs_to_ingest.append(key)
         if not dirs_to_ingest:
             dirs_to_ingest = [str(root)]
 
@@ -280,10 +372,7 @@ def cmd_ingest(args: argparse.Namespace) -> None:
     total_errors: list[str] = []
     elapsed = 0.0
 
-    with console.status(
-        f"[bold cyan]Ingesting {project_name}...[/bold cyan]",
-        spinner="dots",
-    ):
+    with _status(f"[bold cyan]Ingesting {project_name}...[/bold cyan]"):
         for directory in dirs_to_ingest:
             stats = ingest_local_directory(
                 directory=directory,
@@ -315,9 +404,10 @@ def cmd_ingest(args: argparse.Namespace) -> None:
             f"  • {err}" for err in total_errors[:5]
         )
 
-    console.print()
-    console.print(Panel(summary, title="📥 Ingestion Complete", border_style="green"))
-    console.print()
+    blank = Text()
+    console.print(
+        Group(blank, Panel(summary, title="📥 Ingestion Complete", border_style="green"), blank)
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -327,6 +417,8 @@ def cmd_ingest(args: argparse.Namespace) -> None:
 
 def cmd_scan(args: argparse.Namespace) -> None:
     """One-command local indexing workflow for best CLI onboarding UX."""
+    from rich.panel import Panel
+
     from services.cli.docgen.manuals import ManualPackGenerator
     from services.cli.project import find_project_root, load_config
     from services.core.config import get_settings
@@ -370,7 +462,7 @@ def cmd_scan(args: argparse.Namespace) -> None:
             incremental_mode = "fallback-full"
             incremental_warning = str(exc)
 
-    with console.status("[bold cyan]Scanning project and indexing...[/bold cyan]", spinner="dots"):
+    with _status("[bold cyan]Scanning project and indexing...[/bold cyan]"):
         code_stats = ingest_local_directory(
             directory=str(root),
             embedding_provider=provider,
@@ -396,8 +488,6 @@ def cmd_scan(args: argparse.Namespace) -> None:
             )
 
     if args.json:
-        import json
-
         payload: dict[str, object] = {
             "status": "ok",
             "collection": collection,
@@ -419,7 +509,7 @@ def cmd_scan(args: argparse.Namespace) -> None:
                 "skipped_docs": manuals_stats.skipped_docs,
                 "total_chunks": manuals_stats.total_chunks,
             }
-        print(json.dumps(payload, indent=2))
+        _print_json(payload)
         return
 
     lines = [
@@ -471,6 +561,12 @@ def cmd_scan(args: argparse.Namespace) -> None:
 
 def cmd_query(args: argparse.Namespace) -> None:
     """Query the indexed project."""
+    from rich.console import Group
+    from rich.markdown import Markdown
+    from rich.panel import Panel
+    from rich.table import Table
+    from rich.text import Text
+
     from services.api.app.retriever import query
     from services.cli.project import find_project_root, load_config
     from services.cli.remote import _query_remote_with_auth
@@ -489,95 +585,72 @@ def cmd_query(args: argparse.Namespace) -> None:
     embed_provider = get_embedding_provider(settings)
     llm_provider = get_llm_provider(settings)
 
-    # Execute query with loading spinner (only in non-JSON mode)
-    if not args.json:
-        from rich.console import Console
-
-        console = Console()
-        with console.status(
-            "[bold cyan]Processing query...[/bold cyan]",
-            spinner="dots",
-        ):
-            if args.api_url:
-                result = _query_remote_with_auth(
-                    args.question,
-                    args.api_url,
-                    collection_name,
-                    api_key=args.api_key,
-                )
-            else:
-                result = query(
-                    question=args.question,
-                    embedding_provider=embed_provider,
-                    llm_provider=llm_provider,
-                    collection=collection_name,
-                    top_k=args.top_k,
-                    settings=settings,
-                )
-    else:
+    def run_query() -> object:
         if args.api_url:
-            result = _query_remote_with_auth(
+            return _query_remote_with_auth(
                 args.question,
                 args.api_url,
                 collection_name,
                 api_key=args.api_key,
             )
-        else:
-            result = query(
-                question=args.question,
-                embedding_provider=embed_provider,
-                llm_provider=llm_provider,
-                collection=collection_name,
-                top_k=args.top_k,
-                settings=settings,
-            )
+        return query(
+            question=args.question,
+            embedding_provider=embed_provider,
+            llm_provider=llm_provider,
+            collection=collection_name,
+            top_k=args.top_k,
+            settings=settings,
+        )
 
-    # JSON output
+    # Execute query with loading spinner (only in non-JSON mode)
     if args.json:
-        import json
+        result = run_query()
+    else:
+        with _status("[bold cyan]Processing query...[/bold cyan]"):
+            result = run_query()
 
-        print(
-            json.dumps(
-                {
-                    "answer": result.answer,
-                    "citations": result.citations,
-                    "latency_ms": round(result.latency_ms, 1),
-                    "retrieved": result.retrieved,
-                    "retrieval_confidence": getattr(result, "retrieval_confidence", 0.0),
-                    "retrieval_confidence_label": getattr(
-                        result,
-                        "retrieval_confidence_label",
-                        "low",
-                    ),
-                    "mode": result.mode,
-                },
-                indent=2,
-            )
+    # JSON output
+    if args.json:
+        _print_json(
+            {
+                "answer": result.answer,
+                "citations": result.citations,
+                "latency_ms": round(result.latency_ms, 1),
+                "retrieved": result.retrieved,
+                "retrieval_confidence": getattr(result, "retrieval_confidence", 0.0),
+                "retrieval_confidence_label": getattr(
+                    result,
+                    "retrieval_confidence_label",
+                    "low",
+                ),
+                "mode": result.mode,
+            }
         )
         return
 
     # Rich output
-    console.print()
-    console.print(
+    blank = Text()
+    parts: list[object] = [
+        blank,
         Panel(
             Markdown(result.answer),
             title=f"[bold cyan]Answer[/bold cyan] [dim]({result.mode} mode)[/dim]",
             border_style="cyan",
-        )
-    )
+        ),
+    ]
 
     if result.citations:
-        console.print()
+        rows = _citation_rows(result.citations)
+        parts.append(blank)
         if console.width < 80:
-            console.print("[bold magenta]📚 Citations:[/bold magenta]")
-            for i, cite in enumerate(result.citations, 1):
-                source = cite.get("source", "unknown").split("/")[-1]
-                lines = f"{cite.get('line_start', '?')}-{cite.get('line_end', '?')}"
-                score = f"{cite.get('similarity', 0):.1%}"
-                console.print(
+            parts.append(console.render_str("[bold magenta]📚 Citations:[/bold magenta]"))
+            parts += (
+                console.render_str(
                     f"  [dim]{i}.[/dim] [cyan]{source}[/cyan] "
                     f"[yellow]L{lines}[/yellow] [green]{score}[/green]"
                 )
+                for i, source, lines, score in rows
+            )
         else:
             table = Table(
                 title="📚 Citations",
@@ -590,22 +663,21 @@ def cmd_query(args: argparse.Namespace) -> None:
             table.add_column("Lines", justify="center", style="yellow", width=8)
             table.add_column("Score", justify="right", style="green", width=7)
 
-            for i, cite in enumerate(result.citations, 1):
-                source = cite.get("source", "unknown").split("/")[-1]
-                lines = f"{cite.get('line_start', '?')}-{cite.get('line_end', '?')}"
-                score = f"{cite.get('similarity', 0):.1%}"
-                table.add_row(str(i), source, lines, score)
-
-            console.print(table)
-
-    console.print()
-    console.print(
-        f"[dim]Retrieved {result.retrieved} chunks "
-        f"from '{project_name}' in {result.latency_ms:.0f}ms "
-        f"(confidence: {getattr(result, 'retrieval_confidence_label', 'low')} "
-        f"{float(getattr(result, 'retrieval_confidence', 0.0)):.2f})[/dim]"
+            for row in rows:
+                table.add_row(*row)
+            parts.append(table)
+
+    parts += (
+        blank,
+        console.render_str(
+            f"[dim]Retrieved {result.retrieved} chunks "
+            f"from '{project_name}' in {result.latency_ms:.0f}ms "
+            f"(confidence: {getattr(result, 'retrieval_confidence_label', 'low')} "
+            f"{float(getattr(result, 'retrieval_confidence', 0.0)):.2f})[/dim]"
+        ),
+        blank,
     )
-    console.print()
+    console.print(Group(*parts))
 
 
 # ---------------------------------------------------------------------------
@@ -623,6 +695,7 @@ class _ChatShellTurn:
     latency_ms: float
     retrieved: int
     turn_index: int
+    rendered: Group | None = field(default=None, repr=False, compare=False)
 
 
 CHAT_SHELL_MODES = (
@@ -633,9 +706,33 @@ CHAT_SHELL_MODES = (
 )
 CHAT_SHELL_STYLES = ("concise", "detailed")
 
+# Static citation table schema for chat output; built once, reused every turn.
+_CHAT_CITATION_COLUMNS: tuple[tuple[str, dict[str, object]], ...] = (
+    ("#", {"style": "dim", "width": 3, "no_wrap": True}),
+    ("Source", {"style": "cyan", "min_width": 15, "max_width": 30}),
+    ("Lines", {"justify": "center", "style": "yellow", "width": 8, "no_wrap": True}),
+    ("Score", {"justify": "right", "style": "green", "width": 7, "no_wrap": True}),
+)
+_CHAT_SIGNALS_COLUMN: tuple[str, dict[str, object]] = (
+    "Signals",
+    {"style": "magenta", "min_width": 20, "max_width": 40},
+)
+_CHAT_PANEL_TITLE = (
+    "[bold cyan]Chat[/bold cyan] [dim]session={} turn={} mode={} style={}[/dim]"
+).format
+_CHAT_SHELL_EXIT_COMMANDS = frozenset({"exit", "quit", "q"})
+_CHAT_EXIT_INPUTS = frozenset({"exit", "quit", ":q"})
+_CHAT_EXIT_INPUT_MAX_LEN = max(map(len, _CHAT_EXIT_INPUTS))
+_CHAT_SHELL_HELP = "Commands: /help, /clear, /new, /exit, /model <mode>, /style <concise|detailed>"
+# Anything that could change how CommonMark renders the text (block markers, inline markup,
+# entities, line breaks, leading indentation) sends it through the Markdown parser.
+_MARKDOWN_SYNTAX = re.compile(r"[\n#*_`\[\]<>|~&\\]|^\s|^(?:[-+=]|\d+[.)])(?:\s|$)").search
+
 
 def _ragops_version() -> str:
     """Return installed ragops package version, fallback to project version."""
+    import importlib.metadata
+
     try:
         return importlib.metadata.version("ragops")
     except importlib.metadata.PackageNotFoundError:
@@ -675,6 +772,19 @@ def _shorten_home(path: Path) -> str:
         return str(resolved)
 
 
+def _citation_rows(citations: list[dict[str, object]]) -> list[tuple[str, ...]]:
+    """Format citations as (#, file name, line range, score) display rows."""
+    return [
+        (
+            str(i),
+            cite.get("source", "unknown").rsplit("/", 1)[-1],
+            f"{cite.get('line_start', '?')}-{cite.get('line_end', '?')}",
+            f"{cite.get('similarity', 0):.1%}",
+        )
+        for i, cite in enumerate(citations, 1)
+    ]
+
+
 def _citation_summary(citations: list[dict[str, object]], *, limit: int = 3) -> str:
     """Create one-line source summary for inline chat transcript rendering."""
     if not citations:
@@ -714,6 +824,17 @@ def _citation_signal_summary(
     return "; ".join(pieces) + suffix
 
 
+def _chat_text(text: str) -> Markdown | Text:
+    """Render chat text as Markdown only when it contains markdown syntax."""
+    if not text or _MARKDOWN_SYNTAX(text):
+        from rich.markdown import Markdown
+
+        return Markdown(text)
+    from rich.text import Text
+
+    return Text(text)
+
+
 def _parse_chat_shell_command(raw: str) -> tuple[str, str]:
     """Parse `/command arg` input. Empty command returns ('', '')."""
     text = raw.strip()
@@ -723,6 +844,31 @@ def _parse_chat_shell_command(raw: str) -> tuple[str, str]:
     return command.strip().lower(), arg.strip()
 
 
+def _chat_shell_turn_renderable(turn: _ChatShellTurn, *, show_ranking_signals: bool) -> Group:
+    """Build a finished turn's transcript block once; later redraws reuse it."""
+    from rich.console import Group
+    from rich.panel import Panel
+    from rich.text import Text
+
+    if turn.rendered is not None:
+        return turn.rendered
+    subtitle = f"turn {turn.turn_index} • {turn.retrieved} chunks • {turn.latency_ms:.0f}ms"
+    parts: list[object] = [
+        Panel(_chat_text(turn.question), title="you", border_style="green"),
+        Panel(_chat_text(turn.answer), title="assistant", subtitle=subtitle, border_style="cyan"),
+    ]
+    sources = _citation_summary(turn.citations)
+    if sources:
+        parts.append(console.render_str(f"[dim]Sources: {sources}[/dim]"))
+    if show_ranking_signals:
+        signal_summary = _citation_signal_summary(turn.citations)
+        if signal_summary:
+            parts.append(console.render_str(f"[dim]Signals: {signal_summary}[/dim]"))
+    parts.append(Text())
+    turn.rendered = Group(*parts)
+    return turn.rendered
+
+
 def _render_chat_shell(
     *,
     root: Path,
@@ -736,6 +882,8 @@ def _render_chat_shell(
     status_message: str = "",
 ) -> None:
     """Render codex-like chat shell screen for interactive mode."""
+    from rich.panel import Panel
+
     console.clear()
     session_label = session_id or "(new session)"
     console.print(
@@ -769,26 +917,9 @@ def _render_chat_shell(
         )
     else:
         for turn in recent_turns:
-            console.print(Panel(Markdown(turn.question), title="you", border_style="green"))
-            subtitle = (
-                f"turn {turn.turn_index} • {turn.retrieved} chunks • {turn.latency_ms:.0f}ms"
-            )
             console.print(
-                Panel(
-                    Markdown(turn.answer),
-                    title="assistant",
-                    subtitle=subtitle,
-                    border_style="cyan",
-                )
+                _chat_shell_turn_renderable(turn, show_ranking_signals=show_ranking_signals)
             )
-            sources = _citation_summary(turn.citations)
-            if sources:
-                console.print(f"[dim]Sources: {sources}[/dim]")
-            if show_ranking_signals:
-                signal_summary = _citation_signal_summary(turn.citations)
-                if signal_summary:
-                    console.print(f"[dim]Signals: {signal_summary}[/dim]")
-            console.print()
 
     if status_message:
         console.print(f"[yellow]{status_message}[/yellow]")
@@ -802,6 +933,13 @@ def _render_chat_shell(
 
 def cmd_chat(args: argparse.Namespace) -> None:
     """Multi-turn chat with session memory."""
+    import httpx
+    from rich.console import Group
+    from rich.panel import Panel
+    from rich.syntax import Syntax
+    from rich.table import Table
+    from rich.text import Text
+
     from services.api.app.chat import chat
     from services.cli.project import find_project_root, load_config
     from services.cli.remote import _chat_remote
@@ -824,51 +962,20 @@ def cmd_chat(args: argparse.Namespace) -> None:
         if args.show_ranking_signals is None
         else bool(args.show_ranking_signals)
     )
+    as_json = bool(args.json)
+    show_context = bool(args.show_context)
 
     embed_provider = get_embedding_provider(settings)
     llm_provider = get_llm_provider(settings)
+    remote_client: httpx.Client | None = None
 
-    def run_turn(
+    def request_turn(
         question: str,
         session_id: str | None,
         *,
         mode: str,
         answer_style: str,
     ) -> object:
-        if not args.json:
-            from rich.console import Console
-
-            local_console = Console()
-            with local_console.status(
-                "[bold cyan]Processing chat turn...[/bold cyan]",
-                spinner="dots",
-            ):
-                if args.api_url:
-                    return _chat_remote(
-                        question,
-                        args.api_url,
-                        collection_name,
-                        session_id=session_id,
-                        mode=mode,
-                        answer_style=answer_style,
-                        top_k=args.top_k,
-                        include_context=args.show_context,
-                        include_ranking_signals=show_ranking_signals,
-                        api_key=args.api_key,
-                    )
-                return chat(
-                    question=question,
-                    embedding_provider=embed_provider,
-                    llm_provider=llm_provider,
-                    session_id=session_id,
-                    mode=mode,
-                    answer_style=answer_style,
-                    collection=collection_name,
-                    top_k=args.top_k,
-                    include_ranking_signals=show_ranking_signals,
-                    settings=settings,
-                )
-
         if args.api_url:
             return _chat_remote(
                 question,
@@ -878,9 +985,10 @@ def cmd_chat(args: argparse.Namespace) -> None:
                 mode=mode,
                 answer_style=answer_style,
                 top_k=args.top_k,
-                include_context=args.show_context,
+                include_context=show_context,
                 include_ranking_signals=show_ranking_signals,
                 api_key=args.api_key,
+                client=remote_client,
             )
         return chat(
             question=question,
@@ -895,86 +1003,99 @@ def cmd_chat(args: argparse.Namespace) -> None:
             settings=settings,
         )
 
+    def run_turn(
+        question: str,
+        session_id: str | None,
+        *,
+        mode: str,
+        answer_style: str,
+    ) -> object:
+        if as_json:
+            return request_turn(question, session_id, mode=mode, answer_style=answer_style)
+        with _status("[bold cyan]Processing chat turn...[/bold cyan]"):
+            return request_turn(question, session_id, mode=mode, answer_style=answer_style)
+
+    citation_columns = (
+        (*_CHAT_CITATION_COLUMNS, _CHAT_SIGNALS_COLUMN)
+        if show_ranking_signals
+        else _CHAT_CITATION_COLUMNS
+    )
+
+    def new_citation_table() -> Table:
+        table = Table(
+            title="📚 Citations",
+            show_header=True,
+            header_style="bold magenta",
+            expand=False,
+        )
+        for header, options in citation_columns:
+            table.add_column(header, **options)
+        return table
+
     def render_turn(result: object) -> None:
-        if args.json:
-            import json
-
-            print(
-                json.dumps(
-                    {
-                        "session_id": result.session_id,
-                        "answer": result.answer,
-                        "citations": result.citations,
-                        "latency_ms": round(result.latency_ms, 1),
-                        "retrieved": result.retrieved,
-                        "mode": result.mode,
-                        "answer_style": result.answer_style,
-                        "turn_index": result.turn_index,
-                        "context_snippets": result.context_snippets if args.show_context else [],
-                        "show_ranking_signals": show_ranking_signals,
-                    },
-                    indent=2,
-                )
+        if as_json:
+            _print_json(
+                {
+                    "session_id": result.session_id,
+                    "answer": result.answer,
+                    "citations": result.citations,
+                    "latency_ms": round(result.latency_ms, 1),
+                    "retrieved": result.retrieved,
+                    "mode": result.mode,
+                    "answer_style": result.answer_style,
+                    "turn_index": result.turn_index,
+                    "context_snippets": result.context_snippets if show_context else [],
+                    "show_ranking_signals": show_ranking_signals,
+                }
             )
             return
 
-        console.print()
-        session_meta = (
-            f"session={result.session_id} "
-            f"turn={result.turn_index} "
-            f"mode={result.mode} "
-            f"style={result.answer_style}"
-        )
-        console.print(
+        blank = Text()
+        parts: list[object] = [
+            blank,
             Panel(
-                Markdown(result.answer),
-                title=f"[bold cyan]Chat[/bold cyan] [dim]{session_meta}[/dim]",
+                _chat_text(result.answer),
+                title=_CHAT_PANEL_TITLE(
+                    result.session_id, result.turn_index, result.mode, result.answer_style
+                ),
                 border_style="cyan",
-            )
-        )
+            ),
+        ]
         if result.citations:
-            console.print()
-            table = Table(
-                title="📚 Citations",
-                show_header=True,
-                header_style="bold magenta",
-                expand=False,
-            )
-            table.add_column("#", style="dim", width=3, no_wrap=True)
-            table.add_column("Source", style="cyan", min_width=15, max_width=30)
-            table.add_column("Lines", justify="center", style="yellow", width=8, no_wrap=True)
-            table.add_column("Score", justify="right", style="green", width=7, no_wrap=True)
+            table = new_citation_table()
+            rows = _citation_rows(result.citations)
             if show_ranking_signals:
-                table.add_column("Signals", style="magenta", min_width=20, max_width=40)
-            for i, cite in enumerate(result.citations, 1):
-                source = cite.get("source", "unknown")
-                source_short = source.split("/")[-1] if "/" in source else source
-                lines = f"{cite.get('line_start', '?')}-{cite.get('line_end', '?')}"
-                score = f"{cite.get('similarity', 0):.1%}"
-                signals = cite.get("ranking_signals", [])
-                signal_text = ", ".join(str(s) for s in signals) if signals else "-"
-                if show_ranking_signals:
-                    table.add_row(str(i), source_short, lines, score, signal_text)
-                else:
-                    table.add_row(str(i), source_short, lines, score)
-            console.print(table)
-
-        if args.show_context and result.context_snippets:
-            console.print()
-            console.print("[bold]Raw Context Snippets[/bold]")
+                rows = [
+                    (*row, ", ".join(map(str, cite.get("ranking_signals") or ())) or "-")
+                    for row, cite in zip(rows, result.citations)
+                ]
+            for row in rows:
+                table.add_row(*row)
+            parts += (blank, table)
+
+        if show_context and result.context_snippets:
+            parts += (blank, console.render_str("[bold]Raw Context Snippets[/bold]"))
             for i, snippet in enumerate(result.context_snippets, 1):
                 source = snippet.get("source", "unknown")
                 lines = f"{snippet.get('line_start', '?')}-{snippet.get('line_end', '?')}"
                 content = snippet.get("content", "")
-                console.print(f"[dim]{i}.[/dim] [cyan]{source}[/cyan] [yellow]L{lines}[/yellow]")
-                console.print(Markdown(f"```\n{content}\n```"))
+                parts += (
+                    console.render_str(
+                        f"[dim]{i}.[/dim] [cyan]{source}[/cyan] [yellow]L{lines}[/yellow]"
+                    ),
+                    Syntax(content.rstrip(), "text", theme="monokai", word_wrap=True, padding=1),
+                )
 
-        console.print()
-        console.print(
-            f"[dim]Session {result.session_id} • turn {result.turn_index} • "
-            f"{result.retrieved} chunks • {result.latency_ms:.0f}ms[/dim]"
+        parts += (
+            blank,
+            console.render_str(
+                f"[dim]Session {result.session_id} • turn {result.turn_index} • "
+                f"{result.retrieved} chunks • {result.latency_ms:.0f}ms[/dim]"
+            ),
+            blank,
         )
-        console.print()
+        # One print call writes the whole turn in a single flush.
+        console.print(Group(*parts))
 
     if args.question:
         render_turn(
@@ -987,7 +1108,7 @@ def cmd_chat(args: argparse.Namespace) -> None:
         )
         return
 
-    if args.json:
+    if as_json:
         console.print("[red]Error:[/red] Interactive chat mode does not support --json.")
         sys.exit(1)
 
@@ -997,12 +1118,55 @@ def cmd_chat(args: argparse.Namespace) -> None:
     use_shell_ui = (
         sys.stdin.isatty()
         and sys.stdout.isatty()
-        and not args.show_context
+        and not show_context
     )
     provider_label = _format_chat_provider_label(settings, args.api_url)
+    shell_prompt = Text("› ", style="bold bright_cyan")
     turns: list[_ChatShellTurn] = []
     status_message = ""
 
+    def shell_clear(_arg: str) -> str:
+        turns.clear()
+        return "Transcript cleared."
+
+    def shell_new(_arg: str) -> str:
+        nonlocal active_session
+        active_session = None
+        turns.clear()
+        return "Started a new session."
+
+    def shell_help(_arg: str) -> str:
+        return _CHAT_SHELL_HELP
+
+    def shell_mode(arg: str) -> str:
+        nonlocal current_mode
+        next_mode = arg.strip().lower()
+        if not next_mode:
+            return f"Current mode: {current_mode}"
+        if next_mode not in CHAT_SHELL_MODES:
+            return f"Unsupported mode: {next_mode}"
+        current_mode = next_mode
+        return f"Mode set to {current_mode}."
+
+    def shell_style(arg: str) -> str:
+        nonlocal current_style
+        next_style = arg.strip().lower()
+        if not next_style:
+            return f"Current style: {current_style}"
+        if next_style not in CHAT_SHELL_STYLES:
+            return f"Unsupported style: {next_style}"
+        current_style = next_style
+        return f"Style set to {current_style}."
+
+    shell_commands: dict[str, Callable[[str], str]] = {
+        "clear": shell_clear,
+        "new": shell_new,
+        "help": shell_help,
+        "model": shell_mode,
+        "mode": shell_mode,
+        "style": shell_style,
+    }
+
     if not use_shell_ui:
         console.print()
         console.print(
@@ -1016,100 +1180,85 @@ def cmd_chat(args: argparse.Namespace) -> None:
         )
         console.print()
 
-    while True:
-        if use_shell_ui:
-            _render_chat_shell(
-                root=root,
-                collection=collection_name,
-                mode=current_mode,
-                answer_style=current_style,
-                session_id=active_session,
-                provider_label=provider_label,
-                turns=turns,
-                show_ranking_signals=show_ranking_signals,
-                status_message=status_message,
-            )
-            status_message = ""
-
+    if sys.stdin.isatty():
         try:
-            question = (
-                console.input("[bold bright_cyan]› [/bold bright_cyan]")
-                if use_shell_ui
-                else input("you> ")
-            ).strip()
-        except (EOFError, KeyboardInterrupt):
-            console.print()
-            break
-        if not question:
-            continue
-        if question.lower() in {"exit", "quit", ":q"}:
-            break
-
-        if use_shell_ui:
-            command, _arg = _parse_chat_shell_command(question)
-            if command:
-                if command in {"exit", "quit", "q"}:
-                    break
-                if command == "clear":
-                    turns.clear()
-                    status_message = "Transcript cleared."
-                    continue
-                if command == "new":
-                    active_session = None
-                    turns.clear()
-                    status_message = "Started a new session."
-                    continue
-                if command == "help":
+            import readline  # noqa: F401  # line editing + in-session history for input()
+        except ImportError:  # not available on Windows
+            pass
+
+    # Keep one pooled connection open across turns instead of a new handshake per question.
+    if args.api_url:
+        remote_client = httpx.Client(timeout=30.0)
+    try:
+        while True:
+            if use_shell_ui:
+                _render_chat_shell(
+                    root=root,
+                    collection=collection_name,
+                    mode=current_mode,
+                    answer_style=current_style,
+                    session_id=active_session,
+                    provider_label=provider_label,
+                    turns=turns,
+                    show_ranking_signals=show_ranking_signals,
+                    status_message=status_message,
+                )
+                status_message = ""
+
+            try:
+                question = (
+                    console.input(shell_prompt)
+                    if use_shell_ui
+                    else input("you> ")
+                ).strip()
+            except (EOFError, KeyboardInterrupt):
+                console.print()
+                break
+            if not question:
+                continue
+            # Length check first: real questions never need the lowercase copy.
+            if (
+                len(question) <= _CHAT_EXIT_INPUT_MAX_LEN
+                and question.lower() in _CHAT_EXIT_INPUTS
+            ):
+                break
+
+            if use_shell_ui:
+                command, arg = _parse_chat_shell_command(question)
+                if command:
+                    if command in _CHAT_SHELL_EXIT_COMMANDS:
+                        break
+                    handler = shell_commands.get(command)
                     status_message = (
-                        "Commands: /help, /clear, /new, /exit, "
-                        "/model <mode>, /style <concise|detailed>"
+                        handler(arg)
+                        if handler is not None
+                        else f"Unknown command '/{command}'. Try /help."
                     )
                     continue
-                if command in {"model", "mode"}:
-                    next_mode = _arg.strip().lower()
-                    if not next_mode:
-                        status_message = f"Current mode: {current_mode}"
-                        continue
-                    if next_mode not in CHAT_SHELL_MODES:
-                        status_message = f"Unsupported mode: {next_mode}"
-                        continue
-                    current_mode = next_mode
-                    status_message = f"Mode set to {current_mode}."
-                    continue
-                if command == "style":
-                    next_style = _arg.strip().lower()
-                    if not next_style:
-                        status_message = f"Current style: {current_style}"
-                        continue
-                    if next_style not in CHAT_SHELL_STYLES:
-                        status_message = f"Unsupported style: {next_style}"
-                        continue
-                    current_style = next_style
-                    status_message = f"Style set to {current_style}."
-                    continue
-                status_message = f"Unknown command '/{command}'. Try /help."
-                continue
 
-        result = run_turn(
-            question,
-            active_session,
-            mode=current_mode,
-            answer_style=current_style,
-        )
-        active_session = result.session_id
-        if use_shell_ui:
-            turns.append(
-                _ChatShellTurn(
-                    question=question,
-                    answer=result.answer,
-                    citations=result.citations,
-                    latency_ms=result.latency_ms,
-                    retrieved=result.retrieved,
-                    turn_index=result.turn_index,
-                )
+            result = run_turn(
+                question,
+                active_session,
+                mode=current_mode,
+                answer_style=current_style,
             )
-            continue
-        render_turn(result)
+            active_session = result.session_id
+            if use_shell_ui:
+                turns.append(
+                    _ChatShellTurn(
+                        question=question,
+                        answer=result.answer,
+                        citations=result.citations,
+                        latency_ms=result.latency_ms,
+                        retrieved=result.retrieved,
+                        turn_index=result.turn_index,
+                    )
+                )
+                continue
+            render_turn(result)
+    finally:
+        if remote_client is not None:
+            remote_client.close()
 
 
 # ---------------------------------------------------------------------------
@@ -1119,6 +1268,8 @@ def cmd_chat(args: argparse.Namespace) -> None:
 
 def cmd_feedback(args: argparse.Namespace) -> None:
     """Record answer quality feedback."""
+    from rich.panel import Panel
+
     from services.cli.remote import _feedback_remote
     from services.core.config import get_settings
     from services.core.logging import setup_logging
@@ -1127,25 +1278,20 @@ def cmd_feedback(args: argparse.Namespace) -> None:
     settings = get_settings()
     setup_logging("ERROR")
 
+    collection = args.collection or "default"
+    citations = _json_loads(args.citations_json) if args.citations_json else []
+    metadata = _json_loads(args.metadata_json) if args.metadata_json else {}
     payload = {
         "verdict": args.verdict,
-        "collection": args.collection or "default",
+        "collection": collection,
         "session_id": args.session_id,
         "mode": args.mode,
         "question": args.question,
         "answer": args.answer,
         "comment": args.comment,
-        "citations": [],
-        "metadata": {},
+        "citations": citations,
+        "metadata": metadata,
     }
-    if args.citations_json:
-        import json
-
-        payload["citations"] = json.loads(args.citations_json)
-    if args.metadata_json:
-        import json
-
-        payload["metadata"] = json.loads(args.metadata_json)
 
     if args.api_url:
         result = _feedback_remote(args.api_url, payload, api_key=args.api_key)
@@ -1157,29 +1303,22 @@ def cmd_feedback(args: argparse.Namespace) -> None:
             ensure_feedback_table(conn)
             feedback_id = insert_feedback(
                 conn,
-                verdict=str(payload["verdict"]),
-                collection=str(payload["collection"]),
-                mode=str(payload["mode"]),
-                session_id=str(payload["session_id"]) if payload["session_id"] else None,
-                question=str(payload["question"]) if payload["question"] else None,
-                answer=str(payload["answer"]) if payload["answer"] else None,
-                comment=str(payload["comment"]) if payload["comment"] else None,
-                citations=payload["citations"] if isinstance(payload["citations"], list) else [],
-                metadata=payload["metadata"] if isinstance(payload["metadata"], dict) else {},
+                verdict=args.verdict,
+                collection=collection,
+                mode=args.mode,
+                session_id=args.session_id or None,
+                question=args.question or None,
+                answer=args.answer or None,
+                comment=args.comment or None,
+                citations=citations if isinstance(citations, list) else [],
+                metadata=metadata if isinstance(metadata, dict) else {},
             )
         finally:
             conn.close()
         principal = "local_cli"
 
     if args.json:
-        import json
-
-        print(
-            json.dumps(
-                {"status": "ok", "feedback_id": feedback_id, "principal": principal},
-                indent=2,
-            )
-        )
+        _print_json({"status": "ok", "feedback_id": feedback_id, "principal": principal})
         return
 
     console.print()
@@ -1188,7 +1327,7 @@ def cmd_feedback(args: argparse.Namespace) -> None:
             f"[bold green]Feedback recorded[/bold green]\n\n"
             f"[cyan]Feedback ID:[/cyan] {feedback_id}\n"
             f"[cyan]Verdict:[/cyan] {args.verdict}\n"
-            f"[cyan]Collection:[/cyan] {payload['collection']}\n"
+            f"[cyan]Collection:[/cyan] {collection}\n"
             f"[cyan]Principal:[/cyan] {principal}",
             title="ragops feedback",
             border_style="green",
@@ -1204,6 +1343,8 @@ def cmd_feedback(args: argparse.Namespace) -> None:
 
 def cmd_eval(args: argparse.Namespace) -> None:
     """Run dataset-driven evaluation and emit reports."""
+    from rich.panel import Panel
+
     from services.cli.eval import load_eval_cases, render_markdown_report, run_eval
     from services.cli.project import find_project_root, load_config
     from services.core.config import get_settings
@@ -1225,7 +1366,7 @@ def cmd_eval(args: argparse.Namespace) -> None:
     embed_provider = get_embedding_provider(settings)
     llm_provider = None if args.retrieval_only else get_llm_provider(settings)
 
-    with console.status("[bold cyan]Running evaluation...[/bold cyan]", spinner="dots"):
+    with _status("[bold cyan]Running evaluation...[/bold cyan]"):
         cases = load_eval_cases(dataset_path, default_collection=default_collection)
         report = run_eval(
             cases=cases,
@@ -1235,13 +1376,12 @@ def cmd_eval(args: argparse.Namespace) -> None:
             settings=settings,
         )
 
-    import json
-
-    output_json.write_text(json.dumps(report, indent=2))
-    output_md.write_text(render_markdown_report(report))
+    report_json = _json_bytes(report)
+    output_json.write_bytes(report_json)
+    output_md.write_text(render_markdown_report(report), encoding="utf-8")
 
     if args.json:
-        print(json.dumps(report, indent=2))
+        _print_json_bytes(report_json)
         return
 
     summary = report["summary"]
@@ -1268,10 +1408,50 @@ def cmd_eval(args: argparse.Namespace) -> None:
 # ---------------------------------------------------------------------------
 
 
+def _docgen_cache_key(ctx: object, model_id: str) -> str:
+    """Fingerprint everything generated docs depend on: context, model, and prompts."""
+    import hashlib
+
+    from services.cli.docgen.generator import DOC_FOCUS, PROMPT_TEMPLATE
+
+    parts = (_ragops_version(), model_id, PROMPT_TEMPLATE, repr(DOC_FOCUS), repr(ctx))
+    return hashlib.blake2b("\n".join(parts).encode(), digest_size=16).hexdigest()
+
+
+def _store_docgen_cache(cache_dir: Path, docs: dict[str, str]) -> None:
+    """Publish a complete docs cache entry; a partial write never becomes a cache hit."""
+    import shutil
+
+    cache_dir.parent.mkdir(parents=True, exist_ok=True)
+    staging = Path(tempfile.mkdtemp(dir=cache_dir.parent, prefix=".staging-"))
+    try:
+        for filename, content in docs.items():
+            (staging / filename).write_text(content, encoding="utf-8")
+        # --no-cache reruns land on an existing entry; os.replace needs it gone first.
+        shutil.rmtree(cache_dir, ignore_errors=True)
+        os.replace(staging, cache_dir)
+    except BaseException:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+
+
+def _prune_docgen_cache(cache_root: Path, keep: Path) -> None:
+    """Remove every cached docs entry except the one just written."""
+    import shutil
+
+    for entry in cache_root.iterdir():
+        if entry != keep and entry.is_dir():
+            shutil.rmtree(entry, ignore_errors=True)
+
+
 def cmd_generate_docs(args: argparse.Namespace) -> None:
     """Generate documentation from project source code."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    from rich.panel import Panel
+
     from services.cli.docgen.analyzer import Analyzer
-    from services.cli.docgen.generator import DocGenerator
+    from services.cli.docgen.generator import DOC_FOCUS, DocGenerator
     from services.cli.project import find_project_root
     from services.core.config import get_settings
     from services.core.logging import setup_logging
@@ -1292,32 +1472,43 @@ def cmd_generate_docs(args: argparse.Namespace) -> None:
         )
         sys.exit(1)
 
-    analyzer = Analyzer(root)
+    # Keep previously generated docs and ragops state out of the context so reruns
+    # fingerprint the same; hand-written files next to them are still analyzed.
+    generated = [output_dir / name for name in DOC_FOCUS]
+    analyzer = Analyzer(root, exclude_paths=[*generated, root / ".ragops"])
     generator = DocGenerator(llm_provider)
 
-    with console.status(
-        f"[bold cyan]Analyzing {root.name} and generating docs...[/bold cyan]",
-        spinner="dots",
-    ):
+    with _status(f"[bold cyan]Analyzing {root.name} and generating docs...[/bold cyan]"):
         # 1. Analyze code
         ctx = analyzer.analyze()
 
-        # 2. Generate documents
-        docs = {
-            "README.md": generator.generate_readme(ctx),
-            "ARCHITECTURE.md": generator.generate_architecture(ctx),
-            "API.md": generator.generate_api(ctx),
+        # 2. Generate documents (independent LLM round-trips, so overlap them)
+        builders = {
+            "README.md": generator.generate_readme,
+            "ARCHITECTURE.md": generator.generate_architecture,
+            "API.md": generator.generate_api,
         }
+        cache_root = root / ".ragops" / "docgen"
+        cache_dir = cache_root / _docgen_cache_key(ctx, llm_provider.model_id)
+        cached = not args.no_cache and all((cache_dir / name).is_file() for name in builders)
+        if cached:
+            docs = {name: (cache_dir / name).read_text(encoding="utf-8") for name in builders}
+        else:
+            with ThreadPoolExecutor(max_workers=len(builders)) as pool:
+                docs = dict(zip(builders, pool.map(lambda build: build(ctx), builders.values())))
+            _store_docgen_cache(cache_dir, docs)
+            _prune_docgen_cache(cache_root, keep=cache_dir)
 
         # 3. Save files
         for filename, content in docs.items():
             path = output_dir / filename
-            path.write_text(content)
+            path.write_text(content, encoding="utf-8")
 
     console.print()
     console.print(
         Panel(
-            f"[bold green]✅ Documentation generated![/bold green]\n\n"
+            f"[bold green]✅ Documentation generated![/bold green]"
+            f"{' [dim](unchanged source, reused cached docs)[/dim]' if cached else ''}\n\n"
             f"[cyan]Output directory:[/cyan] {args.output}\n"
             f"[cyan]Files created:[/cyan]\n"
             f"  • README.md\n"
@@ -1338,6 +1529,8 @@ def cmd_generate_docs(args: argparse.Namespace) -> None:
 
 def cmd_generate_manuals(args: argparse.Namespace) -> None:
     """Generate deterministic onboarding manuals from code, API, and DB metadata."""
+    from rich.panel import Panel
+
     from services.cli.docgen.manuals import ManualPackGenerator
     from services.cli.project import find_project_root, load_config
     from services.core.config import get_settings
@@ -1353,10 +1546,7 @@ def cmd_generate_manuals(args: argparse.Namespace) -> None:
     generator = ManualPackGenerator(root)
     include_db = not args.no_db
 
-    with console.status(
-        f"[bold cyan]Generating manuals for {root.name}...[/bold cyan]",
-        spinner="dots",
-    ):
+    with _status(f"[bold cyan]Generating manuals for {root.name}...[/bold cyan]"):
         result = generator.generate(
             output_dir=output_dir,
             include_db=include_db,
@@ -1411,6 +1601,45 @@ def cmd_generate_manuals(args: argparse.Namespace) -> None:
 # ---------------------------------------------------------------------------
 
 
+@dataclass(slots=True)
+class _RepoSyncResult:
+    """Outcome of syncing one tracked repo."""
+
+    name: str
+    ref: str
+    ingest_stats: object | None
+    manual_ingest_stats: object | None
+    manuals_collection: str | None
+
+
+@dataclass(slots=True)
+class _RepoMigrationPlan:
+    """Current vs target collection names for one tracked repo."""
+
+    name: str
+    old_code: str
+    new_code: str
+    old_manuals: str | None
+    new_manuals: str
+
+    @property
+    def changed(self) -> bool:
+        return self.old_code != self.new_code or self.old_manuals != self.new_manuals
+
+
+@dataclass(slots=True)
+class _RepoMigrationResult:
+    """Outcome of migrating one tracked repo to split collections."""
+
+    name: str
+    old_code: str
+    new_code: str
+    new_manuals: str | None
+    ingest_stats: object | None
+    manual_ingest_stats: object | None
+    purged: list[dict[str, object]]
+
+
 def _repo_ingest_and_manuals(
     *,
     repo_dir: Path,
@@ -1423,6 +1652,7 @@ def _repo_ingest_and_manuals(
     manuals_output: str | None,
     reset_code_collection: bool = False,
     reset_manuals_collection: bool = False,
+    provider: object | None = None,
 ) -> tuple[object | None, object | None, Path | None, str | None]:
     """Optionally ingest repo and generate manuals."""
     from services.cli.docgen.manuals import ManualPackGenerator
@@ -1435,54 +1665,67 @@ def _repo_ingest_and_manuals(
     manual_output_dir: Path | None = None
     resolved_manuals_collection: str | None = None
 
-    if not skip_ingest:
-        if reset_code_collection:
-            conn = get_connection(settings)
-            try:
-                purge_collection_documents(conn, collection=collection)
-            finally:
-                conn.close()
+    if skip_ingest:
+        provider = None
+    elif provider is None:
         provider = get_embedding_provider(settings)
-        ingest_stats = ingest_local_directory(
-            directory=str(repo_dir),
-            embedding_provider=provider,
-            collection=collection,
-            settings=settings,
-            extra_ignore_dirs={"manuals"},
-        )
-
     if generate_manuals:
         resolved_manuals_collection = manuals_collection or f"{collection}_manuals"
-        manual_output_dir = (
-            Path(manuals_output).expanduser().resolve()
-            if manuals_output
-            else project_root / "manuals" / repo_dir.name
-        )
-        manual_output_dir.mkdir(parents=True, exist_ok=True)
-        generator = ManualPackGenerator(repo_dir)
-        generator.generate(output_dir=manual_output_dir, include_db=False, settings=None)
 
+    # Both resets share one lazily opened connection, but each purge runs right before
+    # its own re-ingest so a failed ingest or manuals build leaves the other intact.
+    purge_conn = None
+
+    def purge(target: str) -> None:
+        nonlocal purge_conn
+        if purge_conn is None:
+            purge_conn = get_connection(settings)
+        purge_collection_documents(purge_conn, collection=target)
+
+    try:
         if not skip_ingest:
-            if reset_manuals_collection:
-                conn = get_connection(settings)
-                try:
-                    purge_collection_documents(conn, collection=resolved_manuals_collection)
-                finally:
-                    conn.close()
-            provider = get_embedding_provider(settings)
-            manual_ingest_stats = ingest_local_directory(
-                directory=str(manual_output_dir),
+            if reset_code_collection:
+                purge(collection)
+            ingest_stats = ingest_local_directory(
+                directory=str(repo_dir),
                 embedding_provider=provider,
-                collection=resolved_manuals_collection,
+                collection=collection,
                 settings=settings,
+                extra_ignore_dirs={"manuals"},
+            )
+
+        if generate_manuals:
+            manual_output_dir = (
+                Path(manuals_output).expanduser().resolve()
+                if manuals_output
+                else project_root / "manuals" / repo_dir.name
             )
+            manual_output_dir.mkdir(parents=True, exist_ok=True)
+            generator = ManualPackGenerator(repo_dir)
+            generator.generate(output_dir=manual_output_dir, include_db=False, settings=None)
+
+            if not skip_ingest:
+                if reset_manuals_collection:
+                    purge(resolved_manuals_collection)
+                manual_ingest_stats = ingest_local_directory(
+                    directory=str(manual_output_dir),
+                    embedding_provider=provider,
+                    collection=resolved_manuals_collection,
+                    settings=settings,
+                )
+    finally:
+        if purge_conn is not None:
+            purge_conn.close()
 
     return ingest_stats, manual_ingest_stats, manual_output_dir, resolved_manuals_collection
 
 
 def cmd_repo_add(args: argparse.Namespace) -> None:
     """Clone a GitHub repo and register it for sync/query workflows."""
-    import os
+    from concurrent.futures import ThreadPoolExecutor
+
+    from rich.panel import Panel
+    from rich.text import Text
 
     from services.cli.project import find_project_root
     from services.cli.repositories import (
@@ -1500,6 +1743,7 @@ def cmd_repo_add(args: argparse.Namespace) -> None:
     )
     from services.core.config import get_settings
     from services.core.logging import setup_logging
+    from services.core.providers import get_embedding_provider
 
     project_root = find_project_root() or Path.cwd()
     settings = get_settings()
@@ -1529,16 +1773,19 @@ def cmd_repo_add(args: argparse.Namespace) -> None:
         )
         sys.exit(1)
 
-    with console.status(
-        f"[bold cyan]Preparing repo {repo_name}...[/bold cyan]",
-        spinner="dots",
-    ):
-        if (repo_dir / ".git").exists():
-            active_ref = sync_repo(destination=repo_dir, ref=args.ref)
-        else:
-            clone_url = build_authenticated_clone_url(canonical_url, token)
-            clone_repo(clone_url=clone_url, destination=repo_dir, ref=args.ref)
-            active_ref = args.ref or "default"
+    with _status(f"[bold cyan]Preparing repo {repo_name}...[/bold cyan]"):
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            # Embedding provider setup (SDK import, client construction) overlaps the clone.
+            provider_future = (
+                None if args.skip_ingest else pool.submit(get_embedding_provider, settings)
+            )
+            if (repo_dir / ".git").exists():
+                active_ref = sync_repo(destination=repo_dir, ref=args.ref)
+            else:
+                clone_url = build_authenticated_clone_url(canonical_url, token)
+                clone_repo(clone_url=clone_url, destination=repo_dir, ref=args.ref)
+                active_ref = args.ref or "default"
+            provider = provider_future.result() if provider_future else None
 
         (
             ingest_stats,
@@ -1556,6 +1803,7 @@ def cmd_repo_add(args: argparse.Namespace) -> None:
             manuals_output=args.manuals_output,
             reset_code_collection=args.reset_code_collection,
             reset_manuals_collection=args.reset_manuals_collection,
+            provider=provider,
         )
 
     timestamp = now_utc_iso()
@@ -1575,8 +1823,6 @@ def cmd_repo_add(args: argparse.Namespace) -> None:
     registry_file = save_repo_registry(project_root, repos)
 
     if args.json:
-        import json
-
         payload: dict[str, object] = {
             "status": "ok",
             "name": repo_name,
@@ -1599,41 +1845,50 @@ def cmd_repo_add(args: argparse.Namespace) -> None:
                 "total_chunks": manual_ingest_stats.total_chunks,
                 "collection": resolved_manuals_collection,
             }
-        print(json.dumps(payload, indent=2))
+        _print_json(payload)
         return
 
+    def labelled(label: str, value: object) -> Text:
+        # Styled spans, not markup: no parser pass, and URLs/paths with "[" stay literal.
+        return Text.assemble((f"{label}:", "cyan"), f" {value}")
+
     lines = [
-        "[bold green]Repository ready[/bold green]",
-        "",
-        f"[cyan]Name:[/cyan] {repo_name}",
-        f"[cyan]URL:[/cyan] {canonical_url}",
-        f"[cyan]Local path:[/cyan] {repo_dir}",
-        f"[cyan]Collection:[/cyan] {collection}",
-        f"[cyan]Manuals collection:[/cyan] {resolved_manuals_collection or 'n/a'}",
-        f"[cyan]Ref:[/cyan] {active_ref}",
-        f"[cyan]Registry:[/cyan] {registry_file}",
+        Text("Repository ready", style="bold green"),
+        Text(),
+        labelled("Name", repo_name),
+        labelled("URL", canonical_url),
+        labelled("Local path", repo_dir),
+        labelled("Collection", collection),
+        labelled("Manuals collection", resolved_manuals_collection or "n/a"),
+        labelled("Ref", active_ref),
+        labelled("Registry", registry_file),
     ]
     if ingest_stats:
         lines.append(
-            f"[cyan]Ingest:[/cyan] {ingest_stats.indexed_docs} indexed, "
-            f"{ingest_stats.skipped_docs} skipped, {ingest_stats.total_chunks} chunks"
+            labelled(
+                "Ingest",
+                f"{ingest_stats.indexed_docs} indexed, "
+                f"{ingest_stats.skipped_docs} skipped, {ingest_stats.total_chunks} chunks",
+            )
         )
     if manual_ingest_stats:
         lines.append(
-            f"[cyan]Manual ingest:[/cyan] {manual_ingest_stats.indexed_docs} indexed, "
-            f"{manual_ingest_stats.skipped_docs} skipped, "
-            f"{manual_ingest_stats.total_chunks} chunks "
-            f"into '{resolved_manuals_collection}'"
+            labelled(
+                "Manual ingest",
+                f"{manual_ingest_stats.indexed_docs} indexed, "
+                f"{manual_ingest_stats.skipped_docs} skipped, "
+                f"{manual_ingest_stats.total_chunks} chunks "
+                f"into '{resolved_manuals_collection}'",
+            )
         )
     console.print()
-    console.print(Panel("\n".join(lines), title="ragops repo add", border_style="green"))
+    console.print(Panel(Text("\n").join(lines), title="ragops repo add", border_style="green"))
     console.print()
 
 
 def cmd_repo_add_lazy(args: argparse.Namespace) -> None:
     """Lazy-onboard a GitHub repo: index file tree only, embed content on-demand."""
-    import os
-    import time
+    from rich.panel import Panel
 
     from services.api.app.repo_onboarding import onboard_github_repo_lazy
     from services.cli.project import find_project_root
@@ -1667,15 +1922,12 @@ def cmd_repo_add_lazy(args: argparse.Namespace) -> None:
         )
         sys.exit(1)
 
-    # Override github_token in settings if provided
+    # Override github_token on a copy; the cached Settings instance is shared.
     if token:
-        settings.github_token = token
+        settings = settings.model_copy(update={"github_token": token})
 
     start = time.perf_counter()
-    with console.status(
-        f"[bold cyan]Lazy onboarding {owner}/{repo}...[/bold cyan]",
-        spinner="dots",
-    ):
+    with _status(f"[bold cyan]Lazy onboarding {owner}/{repo}...[/bold cyan]"):
         result = onboard_github_repo_lazy(
             repo_url=args.repo_url,
             settings=settings,
@@ -1702,15 +1954,13 @@ def cmd_repo_add_lazy(args: argparse.Namespace) -> None:
     registry_file = save_repo_registry(project_root, repos)
 
     if args.json:
-        import json
-
         payload = result.to_dict()
         payload.update({
             "status": "ok",
             "elapsed_seconds": round(elapsed, 2),
             "registry": str(registry_file),
         })
-        print(json.dumps(payload, indent=2))
+        _print_json(payload)
         return
 
     console.print()
@@ -1738,6 +1988,11 @@ def cmd_repo_add_lazy(args: argparse.Namespace) -> None:
 
 def cmd_repo_sync(args: argparse.Namespace) -> None:
     """Pull one or all registered repositories and refresh index/manuals."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    from rich.table import Table
+    from rich.text import Text
+
     from services.cli.project import find_project_root
     from services.cli.repositories import (
         RepoRecord,
@@ -1760,7 +2015,7 @@ def cmd_repo_sync(args: argparse.Namespace) -> None:
         sys.exit(1)
 
     if args.all:
-        target_names = sorted(repos.keys())
+        target_names = sorted(repos)
     else:
         if not args.name:
             console.print("[red]Error:[/red] Provide repo name or use [bold]--all[/bold].")
@@ -1770,12 +2025,22 @@ def cmd_repo_sync(args: argparse.Namespace) -> None:
             sys.exit(1)
         target_names = [args.name]
 
-    results: list[dict[str, object]] = []
-    with console.status("[bold cyan]Syncing repositories...[/bold cyan]", spinner="dots"):
+    repo_dirs = {name: Path(repos[name].local_path).expanduser().resolve() for name in target_names}
+
+    def pull(name: str) -> str:
+        return sync_repo(destination=repo_dirs[name], ref=args.ref or repos[name].ref)
+
+    results: list[_RepoSyncResult] = []
+    with _status("[bold cyan]Syncing repositories...[/bold cyan]"):
+        # Git pulls are independent network round-trips, so run them side by side. Ingest
+        # stays sequential: it shares one embedding quota and (with sqlite) one writer.
+        with ThreadPoolExecutor(max_workers=max(1, min(8, len(target_names)))) as pool:
+            active_refs = dict(zip(target_names, pool.map(pull, target_names)))
+
         for name in target_names:
             record = repos[name]
-            repo_dir = Path(record.local_path).expanduser().resolve()
-            active_ref = sync_repo(destination=repo_dir, ref=args.ref or record.ref)
+            repo_dir = repo_dirs[name]
+            active_ref = active_refs[name]
             generate_manuals = bool(args.generate_manuals or record.manuals_enabled)
             manuals_output = args.manuals_output or record.manuals_output
             collection, manuals_collection = resolve_collection_pair(
@@ -1815,51 +2080,49 @@ def cmd_repo_sync(args: argparse.Namespace) -> None:
             )
             repos[name] = updated
             results.append(
-                {
-                    "name": name,
-                    "ref": active_ref,
-                    "ingest_stats": ingest_stats,
-                    "manual_ingest_stats": manual_ingest_stats,
-                    "manuals_collection": resolved_manuals_collection,
-                }
+                _RepoSyncResult(
+                    name=name,
+                    ref=active_ref,
+                    ingest_stats=ingest_stats,
+                    manual_ingest_stats=manual_ingest_stats,
+                    manuals_collection=resolved_manuals_collection,
+                )
             )
 
     registry_file = save_repo_registry(project_root, repos)
 
     if args.json:
-        import json
-
         payload = {
             "status": "ok",
             "registry": str(registry_file),
             "results": [
                 {
-                    "name": row["name"],
-                    "ref": row["ref"],
+                    "name": row.name,
+                    "ref": row.ref,
                     "ingest": (
                         {
-                            "indexed_docs": row["ingest_stats"].indexed_docs,
-                            "skipped_docs": row["ingest_stats"].skipped_docs,
-                            "total_chunks": row["ingest_stats"].total_chunks,
+                            "indexed_docs": row.ingest_stats.indexed_docs,
+                            "skipped_docs": row.ingest_stats.skipped_docs,
+                            "total_chunks": row.ingest_stats.total_chunks,
                         }
-                        if row["ingest_stats"]
+                        if row.ingest_stats
                         else None
                     ),
                     "manual_ingest": (
                         {
-                            "indexed_docs": row["manual_ingest_stats"].indexed_docs,
-                            "skipped_docs": row["manual_ingest_stats"].skipped_docs,
-                            "total_chunks": row["manual_ingest_stats"].total_chunks,
-                            "collection": row["manuals_collection"],
+                            "indexed_docs": row.manual_ingest_stats.indexed_docs,
+                            "skipped_docs": row.manual_ingest_stats.skipped_docs,
+                            "total_chunks": row.manual_ingest_stats.total_chunks,
+                            "collection": row.manuals_collection,
                         }
-                        if row["manual_ingest_stats"]
+                        if row.manual_ingest_stats
                         else None
                     ),
                 }
                 for row in results
             ],
         }
-        print(json.dumps(payload, indent=2))
+        _print_json(payload)
         return
 
     table = Table(title="🔄 Repo Sync", show_header=True, header_style="bold cyan")
@@ -1868,8 +2131,8 @@ def cmd_repo_sync(args: argparse.Namespace) -> None:
     table.add_column("Ingest", style="green")
     table.add_column("Manuals", style="magenta")
     for row in results:
-        ingest_stats = row["ingest_stats"]
-        manual_ingest_stats = row["manual_ingest_stats"]
+        ingest_stats = row.ingest_stats
+        manual_ingest_stats = row.manual_ingest_stats
         ingest_text = (
             f"{ingest_stats.indexed_docs} idx / {ingest_stats.total_chunks} chunks"
             if ingest_stats
@@ -1880,9 +2143,10 @@ def cmd_repo_sync(args: argparse.Namespace) -> None:
             if manual_ingest_stats
             else "skipped"
         )
-        if manual_ingest_stats and row.get("manuals_collection"):
-            manuals_text = f"{manuals_text} -> {row['manuals_collection']}"
-        table.add_row(str(row["name"]), str(row["ref"]), ingest_text, manuals_text)
+        if manual_ingest_stats and row.manuals_collection:
+            manuals_text = f"{manuals_text} -> {row.manuals_collection}"
+        # Text cells skip Rich's markup parser (and keep "[" in names and refs literal).
+        table.add_row(Text(row.name), Text(str(row.ref)), Text(ingest_text), Text(manuals_text))
 
     console.print()
     console.print(table)
@@ -1890,8 +2154,14 @@ def cmd_repo_sync(args: argparse.Namespace) -> None:
     console.print()
 
 
+_EMPTY_REPO_LIST_JSON = '{\n  "repos": []\n}\n'
+
+
 def cmd_repo_list(args: argparse.Namespace) -> None:
     """List tracked repositories."""
+    from rich.table import Table
+    from rich.text import Text
+
     from services.cli.project import find_project_root
     from services.cli.repositories import load_repo_registry
 
@@ -1899,14 +2169,11 @@ def cmd_repo_list(args: argparse.Namespace) -> None:
     repos = load_repo_registry(project_root)
 
     if args.json:
-        import json
-
-        print(
-            json.dumps(
-                {"repos": [record.to_dict() for _, record in sorted(repos.items())]},
-                indent=2,
-            )
-        )
+        if not repos:
+            # Common probe from tooling: skip the sort and the encoder entirely.
+            sys.stdout.write(_EMPTY_REPO_LIST_JSON)
+            return
+        _print_json({"repos": [repos[name].to_dict() for name in sorted(repos)]})
         return
 
     if not repos:
@@ -1920,14 +2187,15 @@ def cmd_repo_list(args: argparse.Namespace) -> None:
     table.add_column("Local Path", style="dim")
     table.add_column("Manuals Collection", style="yellow")
     table.add_column("Last Sync", style="magenta")
-    for name, record in sorted(repos.items()):
+    for name in sorted(repos):
+        record = repos[name]
         table.add_row(
-            name,
-            record.collection,
-            record.ref or "default",
-            record.local_path,
-            record.manuals_collection or "n/a",
-            record.last_sync_at or "never",
+            Text(name),
+            Text(record.collection),
+            Text(record.ref or "default"),
+            Text(record.local_path),
+            Text(record.manuals_collection or "n/a"),
+            Text(record.last_sync_at or "never"),
         )
 
     console.print()
@@ -1937,6 +2205,8 @@ def cmd_repo_list(args: argparse.Namespace) -> None:
 
 def cmd_repo_migrate_collections(args: argparse.Namespace) -> None:
     """Migrate tracked repos to split code/manual collection names."""
+    from rich.table import Table
+
     from services.cli.project import find_project_root
     from services.cli.repositories import (
         RepoRecord,
@@ -1959,7 +2229,7 @@ def cmd_repo_migrate_collections(args: argparse.Namespace) -> None:
         sys.exit(1)
 
     if args.all:
-        target_names = sorted(repos.keys())
+        target_names = sorted(repos)
     else:
         if not args.name:
             console.print("[red]Error:[/red] Provide repo name or use [bold]--all[/bold].")
@@ -1969,7 +2239,7 @@ def cmd_repo_migrate_collections(args: argparse.Namespace) -> None:
             sys.exit(1)
         target_names = [args.name]
 
-    plans: list[dict[str, object]] = []
+    plans: list[_RepoMigrationPlan] = []
     for name in target_names:
         record = repos[name]
         new_code, new_manuals = resolve_collection_pair(
@@ -1977,18 +2247,22 @@ def cmd_repo_migrate_collections(args: argparse.Namespace) -> None:
             manuals_collection=args.manuals_collection or record.manuals_collection,
         )
         plans.append(
-            {
-                "name": name,
-                "old_code": record.collection,
-                "new_code": new_code,
-                "old_manuals": record.manuals_collection,
-                "new_manuals": new_manuals,
-                "changed": (record.collection != new_code)
-                or (record.manuals_collection != new_manuals),
-            }
+            _RepoMigrationPlan(
+                name=name,
+                old_code=record.collection,
+                new_code=new_code,
+                old_manuals=record.manuals_collection,
+                new_manuals=new_manuals,
+            )
         )
 
     if not args.apply:
+        if not any(plan.changed for plan in plans):
+            console.print(
+                f"\n[green]No collection migrations needed[/green] "
+                f"[dim]({len(plans)} repo(s) already split).[/dim]\n"
+            )
+            return
         table = Table(
             title="🧭 Collection Migration Plan (dry-run)",
             show_header=True,
@@ -2000,14 +2274,14 @@ def cmd_repo_migrate_collections(args: argparse.Namespace) -> None:
         table.add_column("Current Manuals", style="yellow")
         table.add_column("Target Manuals", style="green")
         table.add_column("Change", style="magenta")
-        for row in plans:
+        for plan in plans:
             table.add_row(
-                str(row["name"]),
-                str(row["old_code"]),
-                str(row["new_code"]),
-                str(row["old_manuals"] or "n/a"),
-                str(row["new_manuals"]),
-                "yes" if row["changed"] else "no",
+                plan.name,
+                plan.old_code,
+                plan.new_code,
+                plan.old_manuals or "n/a",
+                plan.new_manuals,
+                "yes" if plan.changed else "no",
             )
         console.print()
         console.print(table)
@@ -2017,115 +2291,115 @@ def cmd_repo_migrate_collections(args: argparse.Namespace) -> None:
         )
         return
 
-    results: list[dict[str, object]] = []
-    with console.status("[bold cyan]Migrating collections...[/bold cyan]", spinner="dots"):
-        for row in plans:
-            name = str(row["name"])
-            record = repos[name]
-            old_code = str(row["old_code"])
-            new_code = str(row["new_code"])
-            new_manuals = str(row["new_manuals"])
-            repo_dir = Path(record.local_path).expanduser().resolve()
+    results: list[_RepoMigrationResult] = []
+    # One connection serves every --purge-old purge instead of reconnecting per repo.
+    purge_conn = get_connection(settings) if args.purge_old else None
+    try:
+        with _status("[bold cyan]Migrating collections...[/bold cyan]"):
+            for plan in plans:
+                name = plan.name
+                record = repos[name]
+                old_code = plan.old_code
+                new_code = plan.new_code
+                new_manuals = plan.new_manuals
+                repo_dir = Path(record.local_path).expanduser().resolve()
+
+                generate_manuals = bool(args.generate_manuals or record.manuals_enabled)
+                manuals_output = args.manuals_output or record.manuals_output
+
+                ingest_stats = None
+                manual_ingest_stats = None
+                manual_output_dir = None
+                resolved_manuals_collection = record.manuals_collection
+
+                if plan.changed or args.reindex:
+                    (
+                        ingest_stats,
+                        manual_ingest_stats,
+                        manual_output_dir,
+                        resolved_manuals_collection,
+                    ) = _repo_ingest_and_manuals(
+                        repo_dir=repo_dir,
+                        collection=new_code,
+                        project_root=project_root,
+                        settings=settings,
+                        skip_ingest=False,
+                        generate_manuals=generate_manuals,
+                        manuals_collection=new_manuals,
+                        manuals_output=manuals_output,
+                        reset_code_collection=args.reset_code_collection,
+                        reset_manuals_collection=args.reset_manuals_collection,
+                    )
 
-            generate_manuals = bool(args.generate_manuals or record.manuals_enabled)
-            manuals_output = args.manuals_output or record.manuals_output
+                purged: list[dict[str, object]] = []
+                if purge_conn is not None and old_code != new_code:
+                    summary = purge_collection_documents(purge_conn, collection=old_code)
+                    purged.append({"collection": old_code, **summary})
 
-            ingest_stats = None
-            manual_ingest_stats = None
-            manual_output_dir = None
-            resolved_manuals_collection = record.manuals_collection
-
-            if bool(row["changed"]) or args.reindex:
-                (
-                    ingest_stats,
-                    manual_ingest_stats,
-                    manual_output_dir,
-                    resolved_manuals_collection,
-                ) = _repo_ingest_and_manuals(
-                    repo_dir=repo_dir,
+                updated = RepoRecord(
+                    name=record.name,
+                    url=record.url,
                     collection=new_code,
-                    project_root=project_root,
-                    settings=settings,
-                    skip_ingest=False,
-                    generate_manuals=generate_manuals,
-                    manuals_collection=new_manuals,
-                    manuals_output=manuals_output,
-                    reset_code_collection=args.reset_code_collection,
-                    reset_manuals_collection=args.reset_manuals_collection,
+                    local_path=record.local_path,
+                    ref=record.ref,
+                    manuals_enabled=generate_manuals,
+                    manuals_collection=resolved_manuals_collection if generate_manuals else None,
+                    manuals_output=str(manual_output_dir) if manual_output_dir else manuals_output,
+                    added_at=record.added_at,
+                    last_sync_at=now_utc_iso(),
                 )
-
-            purged: list[dict[str, object]] = []
-            if args.purge_old and old_code != new_code:
-                conn = get_connection(settings)
-                try:
-                    summary = purge_collection_documents(conn, collection=old_code)
-                    purged.append({"collection": old_code, **summary})
-                finally:
-                    conn.close()
-
-            updated = RepoRecord(
-                name=record.name,
-                url=record.url,
-                collection=new_code,
-                local_path=record.local_path,
-                ref=record.ref,
-                manuals_enabled=generate_manuals,
-                manuals_collection=resolved_manuals_collection if generate_manuals else None,
-                manuals_output=str(manual_output_dir) if manual_output_dir else manuals_output,
-                added_at=record.added_at,
-                last_sync_at=now_utc_iso(),
-            )
-            repos[name] = updated
-            results.append(
-                {
-                    "name": name,
-                    "old_code": old_code,
-                    "new_code": new_code,
-                    "new_manuals": resolved_manuals_collection,
-                    "ingest_stats": ingest_stats,
-                    "manual_ingest_stats": manual_ingest_stats,
-                    "purged": purged,
-                }
-            )
+                repos[name] = updated
+                results.append(
+                    _RepoMigrationResult(
+                        name=name,
+                        old_code=old_code,
+                        new_code=new_code,
+                        new_manuals=resolved_manuals_collection,
+                        ingest_stats=ingest_stats,
+                        manual_ingest_stats=manual_ingest_stats,
+                        purged=purged,
+                    )
+                )
+    finally:
+        if purge_conn is not None:
+            purge_conn.close()
 
     registry_file = save_repo_registry(project_root, repos)
 
     if args.json:
-        import json
-
         payload = {
             "status": "ok",
             "registry": str(registry_file),
             "results": [
                 {
-                    "name": row["name"],
-                    "old_code": row["old_code"],
-                    "new_code": row["new_code"],
-                    "new_manuals": row["new_manuals"],
+                    "name": row.name,
+                    "old_code": row.old_code,
+                    "new_code": row.new_code,
+                    "new_manuals": row.new_manuals,
                     "ingest": (
                         {
-                            "indexed_docs": row["ingest_stats"].indexed_docs,
-                            "skipped_docs": row["ingest_stats"].skipped_docs,
-                            "total_chunks": row["ingest_stats"].total_chunks,
+                            "indexed_docs": row.ingest_stats.indexed_docs,
+                            "skipped_docs": row.ingest_stats.skipped_docs,
+                            "total_chunks": row.ingest_stats.total_chunks,
                         }
-                        if row["ingest_stats"]
+                        if row.ingest_stats
                         else None
                     ),
                     "manual_ingest": (
                         {
-                            "indexed_docs": row["manual_ingest_stats"].indexed_docs,
-                            "skipped_docs": row["manual_ingest_stats"].skipped_docs,
-                            "total_chunks": row["manual_ingest_stats"].total_chunks,
+                            "indexed_docs": row.manual_ingest_stats.indexed_docs,
+                            "skipped_docs": row.manual_ingest_stats.skipped_docs,
+                            "total_chunks": row.manual_ingest_stats.total_chunks,
                         }
-                        if row["manual_ingest_stats"]
+                        if row.manual_ingest_stats
                         else None
                     ),
-                    "purged": row["purged"],
+                    "purged": row.purged,
                 }
                 for row in results
             ],
         }
-        print(json.dumps(payload, indent=2))
+        _print_json(payload)
         return
 
     table = Table(title="✅ Collection Migration", show_header=True, header_style="bold cyan")
@@ -2135,8 +2409,8 @@ def cmd_repo_migrate_collections(args: argparse.Namespace) -> None:
     table.add_column("Ingest", style="magenta")
     table.add_column("Purged", style="red")
     for row in results:
-        ingest_stats = row["ingest_stats"]
-        manual_ingest_stats = row["manual_ingest_stats"]
+        ingest_stats = row.ingest_stats
+        manual_ingest_stats = row.manual_ingest_stats
         ingest_text_parts: list[str] = []
         if ingest_stats:
             ingest_text_parts.append(
@@ -2148,7 +2422,7 @@ def cmd_repo_migrate_collections(args: argparse.Namespace) -> None:
                 f"{manual_ingest_stats.total_chunks} chunks"
             )
         ingest_text = " | ".join(ingest_text_parts) if ingest_text_parts else "skipped"
-        purged_rows = row["purged"]
+        purged_rows = row.purged
         if purged_rows:
             purged_text = ", ".join(
                 f"{p['collection']} ({p['documents_deleted']} docs/{p['chunks_deleted']} chunks)"
@@ -2157,9 +2431,9 @@ def cmd_repo_migrate_collections(args: argparse.Namespace) -> None:
         else:
             purged_text = "none"
         table.add_row(
-            str(row["name"]),
-            str(row["new_code"]),
-            str(row["new_manuals"] or "n/a"),
+            row.name,
+            row.new_code,
+            row.new_manuals or "n/a",
             ingest_text,
             purged_text,
         )
@@ -2186,15 +2460,15 @@ def _mask_secret(value: str) -> str:
 
 def cmd_config_show(args: argparse.Namespace) -> None:
     """Show current user-level ragops config (~/.ragops/config.yaml)."""
+    from rich.panel import Panel
+
     from services.cli.user_config import load_user_config, user_config_path
 
     cfg = load_user_config()
     path = user_config_path()
     if not cfg:
         if args.json:
-            import json
-
-            print(json.dumps({"path": str(path), "config": {}}, indent=2))
+            _print_json({"path": str(path), "config": {}})
             return
         console.print()
         console.print(
@@ -2214,9 +2488,7 @@ def cmd_config_show(args: argparse.Namespace) -> None:
         output["openai_api_key"] = _mask_secret(secret)
 
     if args.json:
-        import json
-
-        print(json.dumps({"path": str(path), "config": output}, indent=2))
+        _print_json({"path": str(path), "config": output})
         return
 
     lines = [
@@ -2235,6 +2507,8 @@ def cmd_config_show(args: argparse.Namespace) -> None:
 
 def cmd_config_set(args: argparse.Namespace) -> None:
     """Set user-level ragops config values (~/.ragops/config.yaml)."""
+    from rich.panel import Panel
+
     from services.cli.user_config import save_user_config
 
     updates: dict[str, object] = {}
@@ -2260,23 +2534,18 @@ def cmd_config_set(args: argparse.Namespace) -> None:
     path = save_user_config(updates)
     masked_key = _mask_secret(str(updates.get("openai_api_key", "")).strip())
     if args.json:
-        import json
-
-        print(
-            json.dumps(
-                {
-                    "status": "ok",
-                    "path": str(path),
-                    "updated": {
-                        "openai_api_key": masked_key,
-                        "llm_enabled": updates.get("llm_enabled"),
-                        "storage_backend": updates.get("storage_backend"),
-                        "local_db_path": updates.get("local_db_path"),
-                        "show_ranking_signals": updates.get("show_ranking_signals"),
-                    },
+        _print_json(
+            {
+                "status": "ok",
+                "path": str(path),
+                "updated": {
+                    "openai_api_key": masked_key,
+                    "llm_enabled": updates.get("llm_enabled"),
+                    "storage_backend": updates.get("storage_backend"),
+                    "local_db_path": updates.get("local_db_path"),
+                    "show_ranking_signals": updates.get("show_ranking_signals"),
                 },
-                indent=2,
-            )
+            }
         )
         return
 
@@ -2297,8 +2566,27 @@ def cmd_config_set(args: argparse.Namespace) -> None:
     console.print()
 
 
+def _api_key_source(runtime_key: str, project_key: str, global_key: str) -> str:
+    """Name the origin of the effective OPENAI_API_KEY for config doctor."""
+    if runtime_key:
+        if runtime_key == project_key:
+            return "project_env"
+        if runtime_key == global_key and not project_key:
+            return "global_config"
+        return "environment"
+    if project_key:
+        return "project_env"
+    return "global_config" if global_key else "missing"
+
+
+_DOCTOR_STATUS_ICONS = {"ok": "✅", "warn": "⚠️", "error": "❌"}
+_DOCTOR_STATUS_BORDERS = {"ok": "green", "warn": "yellow", "error": "red"}
+
+
 def cmd_config_doctor(args: argparse.Namespace) -> None:
     """Run config diagnostics across global config, project env, and storage backend."""
+    from rich.panel import Panel
+
     from services.cli.project import find_project_root
     from services.cli.user_config import load_user_config, user_config_path
     from services.core.config import get_settings
@@ -2309,6 +2597,7 @@ def cmd_config_doctor(args: argparse.Namespace) -> None:
     global_cfg = load_user_config()
     global_cfg_path = user_config_path()
     fixes_applied: list[str] = []
+    env_values = _read_env_values(project_env_path)
 
     if args.fix:
         updates: dict[str, str] = {}
@@ -2317,22 +2606,23 @@ def cmd_config_doctor(args: argparse.Namespace) -> None:
         global_local_db = str(global_cfg.get("local_db_path", "")).strip()
         raw_llm_enabled = str(global_cfg.get("llm_enabled", "")).strip().lower()
 
-        if not _read_env_value(project_env_path, "STORAGE_BACKEND"):
+        if not env_values.get("STORAGE_BACKEND"):
             updates["STORAGE_BACKEND"] = global_backend or "sqlite"
-        if not _read_env_value(project_env_path, "LOCAL_DB_PATH"):
+        if not env_values.get("LOCAL_DB_PATH"):
             updates["LOCAL_DB_PATH"] = global_local_db or ".ragops/ragops.db"
-        if not _read_env_value(project_env_path, "LLM_ENABLED"):
+        if not env_values.get("LLM_ENABLED"):
             if raw_llm_enabled in {"1", "true", "yes", "on"}:
                 updates["LLM_ENABLED"] = "true"
             elif raw_llm_enabled in {"0", "false", "no", "off"}:
                 updates["LLM_ENABLED"] = "false"
             else:
                 updates["LLM_ENABLED"] = "false"
-        if not _read_env_value(project_env_path, "OPENAI_API_KEY") and global_key:
+        if not env_values.get("OPENAI_API_KEY") and global_key:
             updates["OPENAI_API_KEY"] = global_key
 
         if updates:
             _upsert_env_values(project_env_path, updates)
+            env_values.update(updates)
             for key, value in updates.items():
                 if key == "OPENAI_API_KEY":
                     fixes_applied.append(f"{key}={_mask_secret(value)}")
@@ -2341,22 +2631,11 @@ def cmd_config_doctor(args: argparse.Namespace) -> None:
 
     settings = get_settings()
 
-    project_env_key = _read_env_value(project_env_path, "OPENAI_API_KEY")
+    project_env_key = env_values.get("OPENAI_API_KEY", "")
     runtime_env_key = os.getenv("OPENAI_API_KEY", "").strip()
     global_key = str(global_cfg.get("openai_api_key", "")).strip()
     effective_key = runtime_env_key or project_env_key or global_key
-    if runtime_env_key and project_env_key and runtime_env_key == project_env_key:
-        key_source = "project_env"
-    elif runtime_env_key and global_key and runtime_env_key == global_key and not project_env_key:
-        key_source = "global_config"
-    elif runtime_env_key:
-        key_source = "environment"
-    elif project_env_key:
-        key_source = "project_env"
-    elif global_key:
-        key_source = "global_config"
-    else:
-        key_source = "missing"
+    key_source = _api_key_source(runtime_env_key, project_env_key, global_key)
 
     backend = resolve_storage_backend(settings)
     storage_ok = False
@@ -2438,12 +2717,9 @@ def cmd_config_doctor(args: argparse.Namespace) -> None:
     }
 
     if args.json:
-        import json
-
-        print(json.dumps(payload, indent=2))
+        _print_json(payload)
         return
 
-    icon = {"ok": "✅", "warn": "⚠️", "error": "❌"}
     lines = [
         f"[cyan]Project root:[/cyan] {project_root}",
         f"[cyan]Global config:[/cyan] {global_cfg_path}",
@@ -2457,21 +2733,17 @@ def cmd_config_doctor(args: argparse.Namespace) -> None:
         else:
             lines.append("[cyan]Fix applied:[/cyan] none (nothing missing)")
     lines.extend(["", "[cyan]Checks:[/cyan]"])
-    for check in checks:
-        symbol = icon.get(str(check["status"]), "•")
-        lines.append(f"{symbol} {check['name']}: {check['message']}")
-
-    border = (
-        "green"
-        if overall_status == "ok"
-        else ("yellow" if overall_status == "warn" else "red")
+    lines.extend(
+        f"{_DOCTOR_STATUS_ICONS.get(str(check['status']), '•')} {check['name']}: {check['message']}"
+        for check in checks
     )
+
     console.print()
     console.print(
         Panel(
             "\n".join(lines),
             title=f"ragops config doctor ({overall_status})",
-            border_style=border,
+            border_style=_DOCTOR_STATUS_BORDERS.get(overall_status, "red"),
         )
     )
     console.print()
@@ -2484,6 +2756,8 @@ def cmd_config_doctor(args: argparse.Namespace) -> None:
 
 def cmd_migrate_embedding_dimension(args: argparse.Namespace) -> None:
     """Migrate stored embedding dimension and clear stale vectors/documents."""
+    from rich.panel import Panel
+
     from services.core.config import get_settings
     from services.core.logging import setup_logging
     from services.core.storage import (
@@ -2545,6 +2819,22 @@ def cmd_migrate_embedding_dimension(args: argparse.Namespace) -> None:
 # providers
 # ---------------------------------------------------------------------------
 
+# (id, name, models, features, key env var)
+_LLM_PROVIDERS = (
+    ("openai", "OpenAI", "gpt-4o, gpt-4o-mini", "LLM + Embed", "OPENAI_API_KEY"),
+    ("gemini", "Google Gemini", "gemini-2.0-flash", "LLM + Embed", "GEMINI_API_KEY"),
+    ("claude", "Anthropic Claude", "claude-sonnet-4-20250514", "LLM only", "ANTHROPIC_API_KEY"),
+    ("groq", "Groq", "llama-3.3-70b-versatile", "LLM only (fast)", "GROQ_API_KEY"),
+    ("ollama", "Ollama (Local)", "llama3, mistral, etc.", "LLM + Embed", "(none)"),
+    (
+        "huggingface",
+        "Hugging Face",
+        "sentence-transformers/* (configurable)",
+        "Embed only",
+        "HUGGINGFACE_API_KEY",
+    ),
+)
+
 
 def cmd_providers(args: argparse.Namespace) -> None:
     """Show available LLM and embedding providers."""
@@ -2552,44 +2842,26 @@ def cmd_providers(args: argparse.Namespace) -> None:
 
     settings = get_settings()
 
-    llm_providers = {
-        "openai": {
-            "name": "OpenAI",
-            "models": "gpt-4o, gpt-4o-mini",
-            "key": "OPENAI_API_KEY",
-            "features": "LLM + Embed",
-        },
-        "gemini": {
-            "name": "Google Gemini",
-            "models": "gemini-2.0-flash",
-            "key": "GEMINI_API_KEY",
-            "features": "LLM + Embed",
-        },
-        "claude": {
-            "name": "Anthropic Claude",
-            "models": "claude-sonnet-4-20250514",
-            "key": "ANTHROPIC_API_KEY",
-            "features": "LLM only",
-        },
-        "groq": {
-            "name": "Groq",
-            "models": "llama-3.3-70b-versatile",
-            "key": "GROQ_API_KEY",
-            "features": "LLM only (fast)",
-        },
-        "ollama": {
-            "name": "Ollama (Local)",
-            "models": "llama3, mistral, etc.",
-            "key": "(none)",
-            "features": "LLM + Embed",
-        },
-        "huggingface": {
-            "name": "Hugging Face",
-            "models": "sentence-transformers/* (configurable)",
-            "key": "HUGGINGFACE_API_KEY",
-            "features": "Embed only",
-        },
-    }
+    active_by_id: dict[str, list[str]] = {}
+    for pid, *_ in _LLM_PROVIDERS:
+        active_parts = []
+        if settings.llm_provider == pid:
+            active_parts.append("LLM")
+        if settings.embedding_provider == pid:
+            active_parts.append("Embed")
+        active_by_id[pid] = active_parts
+
+    if not console.is_terminal:
+        # Piped (e.g. `ragops providers | grep openai`): one tab-separated row per provider.
+        sys.stdout.write(
+            "".join(
+                "\t".join((*row, ", ".join(active_by_id[row[0]]) or "-")) + "\n"
+                for row in _LLM_PROVIDERS
+            )
+        )
+        return
+
+    from rich.table import Table
 
     table = Table(
         title="🔌 Available Providers",
@@ -2603,25 +2875,15 @@ def cmd_providers(args: argparse.Namespace) -> None:
     table.add_column("Key", style="dim", width=18)
     table.add_column("Active", justify="center", width=8)
 
-    for pid, info in llm_providers.items():
-        is_llm = settings.llm_provider == pid
-        is_embed = settings.embedding_provider == pid
-        active_parts = []
-        if is_llm:
-            active_parts.append("LLM")
-        if is_embed:
-            active_parts.append("Embed")
+    for pid, name, models, features, key in _LLM_PROVIDERS:
+        active_parts = active_by_id[pid]
         active = (
             "[bold green]" + ", ".join(active_parts) + "[/bold green]"
             if active_parts
             else "[dim]—[/dim]"
         )
 
-        table.add_row(
-            pid, info["name"], info["models"],
-            info["features"], info["key"], active,
-        )
-
+        table.add_row(pid, name, models, features, key, active)
 
     console.print()
     console.print(table)
@@ -2642,17 +2904,42 @@ def cmd_providers(args: argparse.Namespace) -> None:
 # ---------------------------------------------------------------------------
 
 
-def build_parser() -> argparse.ArgumentParser:
-    """Build the ragops CLI argument parser."""
-    parser = argparse.ArgumentParser(
-        prog="ragops",
-        description="RAG Ops — Query any codebase with AI",
-    )
-    parser.add_argument("--version", action="version", version="ragops 2.0.0")
-    sub = parser.add_subparsers(dest="command", help="Available commands")
+_VERSION = "ragops 2.0.0"
+
+_STORAGE_BACKEND_CHOICES = ("sqlite", "postgres", "auto")
+_BOOL_CHOICES = ("true", "false")
 
-    # --- init ---
-    p_init = sub.add_parser("init", help="Initialize ragops in a project")
+_COMMAND_HELP: dict[str, str] = {
+    "init": "Initialize ragops in a project",
+    "ingest": "Index docs and code",
+    "scan": "One-command scan: ingest project + generate manuals + ingest manuals",
+    "query": "Ask questions about your project",
+    "chat": "Multi-turn chat about your project",
+    "feedback": "Submit answer quality feedback",
+    "eval": "Run dataset-based quality evaluation",
+    "generate-docs": "Auto-generate docs from source code",
+    "generate-manuals": "Generate onboarding manuals (codebase, API, database)",
+    "config": "Manage global ragops config (~/.ragops/config.yaml)",
+    "providers": "Show available LLM/Embedding providers",
+    "migrate-embedding-dimension": "Migrate embedding dimension and clear stale indexed vectors",
+    "repo": "Manage GitHub repositories for indexing and chat",
+}
+
+
+def _add_json_arg(parser: argparse.ArgumentParser, help_text: str = "Output raw JSON") -> None:
+    """Add the shared --json output flag."""
+    parser.add_argument("--json", action="store_true", help=help_text)
+
+
+def _add_remote_args(parser: argparse.ArgumentParser, *, url_help: str) -> None:
+    """Add the shared --api-url/--api-key pair for remote API commands."""
+    parser.add_argument("--api-url", help=url_help)
+    parser.add_argument("--api-key", help="API key header value for secured remote APIs")
+
+
+def _build_init_parser(sub: argparse._SubParsersAction) -> None:
+    """Register the `init` subcommand."""
+    p_init = sub.add_parser("init", help=_COMMAND_HELP["init"])
     p_init.add_argument(
         "path",
         nargs="?",
@@ -2664,7 +2951,7 @@ def build_parser() -> argparse.ArgumentParser:
     p_init.add_argument(
         "--storage-backend",
         default="sqlite",
-        choices=["sqlite", "postgres", "auto"],
+        choices=_STORAGE_BACKEND_CHOICES,
         help="Default storage backend written to .env",
     )
     p_init.add_argument(
@@ -2674,7 +2961,7 @@ def build_parser() -> argparse.ArgumentParser:
     )
     p_init.add_argument(
         "--llm-enabled",
-        choices=["true", "false"],
+        choices=_BOOL_CHOICES,
         help="Explicit LLM_ENABLED value written to .env",
     )
     p_init.add_argument(
@@ -2689,8 +2976,10 @@ def build_parser() -> argparse.ArgumentParser:
     )
     p_init.set_defaults(func=cmd_init)
 
-    # --- ingest ---
-    p_ingest = sub.add_parser("ingest", help="Index docs and code")
+
+def _build_ingest_parser(sub: argparse._SubParsersAction) -> None:
+    """Register the `ingest` subcommand."""
+    p_ingest = sub.add_parser("ingest", help=_COMMAND_HELP["ingest"])
     p_ingest.add_argument(
         "--dir",
         help="Specific directory to ingest (overrides config)",
@@ -2705,11 +2994,10 @@ def build_parser() -> argparse.ArgumentParser:
     )
     p_ingest.set_defaults(func=cmd_ingest)
 
-    # --- scan ---
-    p_scan = sub.add_parser(
-        "scan",
-        help="One-command scan: ingest project + generate manuals + ingest manuals",
-    )
+
+def _build_scan_parser(sub: argparse._SubParsersAction) -> None:
+    """Register the `scan` subcommand."""
+    p_scan = sub.add_parser("scan", help=_COMMAND_HELP["scan"])
     p_scan.add_argument(
         "path",
         nargs="?",
@@ -2740,15 +3028,13 @@ def build_parser() -> argparse.ArgumentParser:
         default="HEAD",
         help="Git base ref used with --incremental (default: HEAD)",
     )
-    p_scan.add_argument(
-        "--json",
-        action="store_true",
-        help="Output raw JSON",
-    )
+    _add_json_arg(p_scan)
     p_scan.set_defaults(func=cmd_scan)
 
-    # --- query ---
-    p_query = sub.add_parser("query", help="Ask questions about your project")
+
+def _build_query_parser(sub: argparse._SubParsersAction) -> None:
+    """Register the `query` subcommand."""
+    p_query = sub.add_parser("query", help=_COMMAND_HELP["query"])
     p_query.add_argument("question", help="Your question")
     p_query.add_argument(
         "--project",
@@ -2764,23 +3050,17 @@ def build_parser() -> argparse.ArgumentParser:
         default=5,
         help="Number of results",
     )
-    p_query.add_argument(
-        "--json",
-        action="store_true",
-        help="Output raw JSON",
-    )
-    p_query.add_argument(
-        "--api-url",
-        help="Query a remote RAG Ops API (e.g. AWS endpoint)",
-    )
-    p_query.add_argument(
-        "--api-key",
-        help="API key header value for secured remote APIs",
+    _add_json_arg(p_query)
+    _add_remote_args(
+        p_query,
+        url_help="Query a remote RAG Ops API (e.g. AWS endpoint)",
     )
     p_query.set_defaults(func=cmd_query)
 
-    # --- chat ---
-    p_chat = sub.add_parser("chat", help="Multi-turn chat about your project")
+
+def _build_chat_parser(sub: argparse._SubParsersAction) -> None:
+    """Register the `chat` subcommand."""
+    p_chat = sub.add_parser("chat", help=_COMMAND_HELP["chat"])
     p_chat.add_argument(
         "question",
         nargs="?",
@@ -2801,13 +3081,13 @@ def build_parser() -> argparse.ArgumentParser:
     p_chat.add_argument(
         "--mode",
         default="default",
-        choices=["default", "explain_like_junior", "show_where_in_code", "step_by_step"],
+        choices=CHAT_SHELL_MODES,
         help="Response style mode",
     )
     p_chat.add_argument(
         "--answer-style",
         default="concise",
-        choices=["concise", "detailed"],
+        choices=CHAT_SHELL_STYLES,
         help="Answer verbosity/style profile",
     )
     p_chat.add_argument(
@@ -2816,18 +3096,10 @@ def build_parser() -> argparse.ArgumentParser:
         default=5,
         help="Number of retrieval results",
     )
-    p_chat.add_argument(
-        "--json",
-        action="store_true",
-        help="Output raw JSON",
-    )
-    p_chat.add_argument(
-        "--api-url",
-        help="Chat against a remote RAG Ops API (base URL or /v1/chat endpoint)",
-    )
-    p_chat.add_argument(
-        "--api-key",
-        help="API key header value for secured remote APIs",
+    _add_json_arg(p_chat)
+    _add_remote_args(
+        p_chat,
+        url_help="Chat against a remote RAG Ops API (base URL or /v1/chat endpoint)",
     )
     p_chat.add_argument(
         "--show-context",
@@ -2850,8 +3122,10 @@ def build_parser() -> argparse.ArgumentParser:
     )
     p_chat.set_defaults(func=cmd_chat)
 
-    # --- feedback ---
-    p_feedback = sub.add_parser("feedback", help="Submit answer quality feedback")
+
+def _build_feedback_parser(sub: argparse._SubParsersAction) -> None:
+    """Register the `feedback` subcommand."""
+    p_feedback = sub.add_parser("feedback", help=_COMMAND_HELP["feedback"])
     p_feedback.add_argument(
         "--verdict",
         required=True,
@@ -2892,23 +3166,17 @@ def build_parser() -> argparse.ArgumentParser:
         "--metadata-json",
         help="JSON object of metadata (optional)",
     )
-    p_feedback.add_argument(
-        "--api-url",
-        help="Remote API base URL or /v1/feedback endpoint",
-    )
-    p_feedback.add_argument(
-        "--api-key",
-        help="API key header value for secured remote APIs",
-    )
-    p_feedback.add_argument(
-        "--json",
-        action="store_true",
-        help="Output raw JSON",
+    _add_remote_args(
+        p_feedback,
+        url_help="Remote API base URL or /v1/feedback endpoint",
     )
+    _add_json_arg(p_feedback)
     p_feedback.set_defaults(func=cmd_feedback)
 
-    # --- eval ---
-    p_eval = sub.add_parser("eval", help="Run dataset-based quality evaluation")
+
+def _build_eval_parser(sub: argparse._SubParsersAction) -> None:
+    """Register the `eval` subcommand."""
+    p_eval = sub.add_parser("eval", help=_COMMAND_HELP["eval"])
     p_eval.add_argument(
         "--dataset",
         required=True,
@@ -2939,27 +3207,29 @@ def build_parser() -> argparse.ArgumentParser:
         default="./eval/eval-report.md",
         help="Path to markdown report",
     )
-    p_eval.add_argument(
-        "--json",
-        action="store_true",
-        help="Print JSON report to stdout",
-    )
+    _add_json_arg(p_eval, help_text="Print JSON report to stdout")
     p_eval.set_defaults(func=cmd_eval)
 
-    # --- generate-docs ---
-    p_docs = sub.add_parser("generate-docs", help="Auto-generate docs from source code")
+
+def _build_generate_docs_parser(sub: argparse._SubParsersAction) -> None:
+    """Register the `generate-docs` subcommand."""
+    p_docs = sub.add_parser("generate-docs", help=_COMMAND_HELP["generate-docs"])
     p_docs.add_argument(
         "--output",
         default="./docs",
         help="Output directory (default: ./docs)",
     )
+    p_docs.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Regenerate even if the source is unchanged since the last run",
+    )
     p_docs.set_defaults(func=cmd_generate_docs)
 
-    # --- generate-manuals ---
-    p_manuals = sub.add_parser(
-        "generate-manuals",
-        help="Generate onboarding manuals (codebase, API, database)",
-    )
+
+def _build_generate_manuals_parser(sub: argparse._SubParsersAction) -> None:
+    """Register the `generate-manuals` subcommand."""
+    p_manuals = sub.add_parser("generate-manuals", help=_COMMAND_HELP["generate-manuals"])
     p_manuals.add_argument(
         "--output",
         default="./manuals",
@@ -2981,20 +3251,21 @@ def build_parser() -> argparse.ArgumentParser:
     )
     p_manuals.set_defaults(func=cmd_generate_manuals)
 
-    # --- config ---
-    p_config = sub.add_parser("config", help="Manage global ragops config (~/.ragops/config.yaml)")
-    config_sub = p_config.add_subparsers(dest="config_command", help="Config commands")
-    config_sub.required = True
 
+def _build_config_show_parser(config_sub: argparse._SubParsersAction) -> None:
+    """Register the `config show` subcommand."""
     p_config_show = config_sub.add_parser("show", help="Show current global config")
     p_config_show.add_argument(
         "--reveal-secrets",
         action="store_true",
         help="Show full secret values (default masks secrets)",
     )
-    p_config_show.add_argument("--json", action="store_true", help="Output raw JSON")
+    _add_json_arg(p_config_show)
     p_config_show.set_defaults(func=cmd_config_show)
 
+
+def _build_config_set_parser(config_sub: argparse._SubParsersAction) -> None:
+    """Register the `config set` subcommand."""
     p_config_set = config_sub.add_parser("set", help="Set global config values")
     p_config_set.add_argument("--openai-api-key", help="Set OPENAI_API_KEY in global config")
     p_config_set.add_argument(
@@ -3004,12 +3275,12 @@ def build_parser() -> argparse.ArgumentParser:
     )
     p_config_set.add_argument(
         "--llm-enabled",
-        choices=["true", "false"],
+        choices=_BOOL_CHOICES,
         help="Set default llm_enabled in global config",
     )
     p_config_set.add_argument(
         "--storage-backend",
-        choices=["sqlite", "postgres", "auto"],
+        choices=_STORAGE_BACKEND_CHOICES,
         help="Set default storage backend in global config",
     )
     p_config_set.add_argument(
@@ -3018,12 +3289,15 @@ def build_parser() -> argparse.ArgumentParser:
     )
     p_config_set.add_argument(
         "--show-ranking-signals",
-        choices=["true", "false"],
+        choices=_BOOL_CHOICES,
         help="Set default ranking signal visibility for chat output",
     )
-    p_config_set.add_argument("--json", action="store_true", help="Output raw JSON")
+    _add_json_arg(p_config_set)
     p_config_set.set_defaults(func=cmd_config_set)
 
+
+def _build_config_doctor_parser(config_sub: argparse._SubParsersAction) -> None:
+    """Register the `config doctor` subcommand."""
     p_config_doctor = config_sub.add_parser(
         "doctor",
         help="Diagnose effective config, key source, and storage health",
@@ -3033,17 +3307,32 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Write missing local defaults into project .env (non-destructive)",
     )
-    p_config_doctor.add_argument("--json", action="store_true", help="Output raw JSON")
+    _add_json_arg(p_config_doctor)
     p_config_doctor.set_defaults(func=cmd_config_doctor)
 
-    # --- providers ---
-    p_providers = sub.add_parser("providers", help="Show available LLM/Embedding providers")
+
+def _build_config_parser(sub: argparse._SubParsersAction) -> None:
+    """Register the `config` subcommand."""
+    p_config = sub.add_parser("config", help=_COMMAND_HELP["config"])
+    config_sub = p_config.add_subparsers(dest="config_command", help="Config commands")
+    config_sub.required = True
+
+    _build_config_show_parser(config_sub)
+    _build_config_set_parser(config_sub)
+    _build_config_doctor_parser(config_sub)
+
+
+def _build_providers_parser(sub: argparse._SubParsersAction) -> None:
+    """Register the `providers` subcommand."""
+    p_providers = sub.add_parser("providers", help=_COMMAND_HELP["providers"])
     p_providers.set_defaults(func=cmd_providers)
 
-    # --- migrate-embedding-dimension ---
+
+def _build_migrate_embedding_dimension_parser(sub: argparse._SubParsersAction) -> None:
+    """Register the `migrate-embedding-dimension` subcommand."""
     p_migrate_embedding = sub.add_parser(
         "migrate-embedding-dimension",
-        help="Migrate embedding dimension and clear stale indexed vectors",
+        help=_COMMAND_HELP["migrate-embedding-dimension"],
     )
     p_migrate_embedding.add_argument(
         "--dimension",
@@ -3058,11 +3347,23 @@ def build_parser() -> argparse.ArgumentParser:
     )
     p_migrate_embedding.set_defaults(func=cmd_migrate_embedding_dimension)
 
-    # --- repo ---
-    p_repo = sub.add_parser("repo", help="Manage GitHub repositories for indexing and chat")
-    repo_sub = p_repo.add_subparsers(dest="repo_command", help="Repo commands")
-    repo_sub.required = True
 
+def _add_reset_collection_args(parser: argparse.ArgumentParser, *, before: str) -> None:
+    """Add the --reset-code-collection/--reset-manuals-collection pair for repo commands."""
+    parser.add_argument(
+        "--reset-code-collection",
+        action="store_true",
+        help=f"Purge target code collection before {before}",
+    )
+    parser.add_argument(
+        "--reset-manuals-collection",
+        action="store_true",
+        help=f"Purge target manuals collection before {before} manuals",
+    )
+
+
+def _build_repo_add_parser(repo_sub: argparse._SubParsersAction) -> None:
+    """Register the `repo add` subcommand."""
     p_repo_add = repo_sub.add_parser("add", help="Clone/register a GitHub repo and ingest it")
     p_repo_add.add_argument("repo_url", help="GitHub URL (https://github.com/org/repo or git@...)")
     p_repo_add.add_argument("--name", help="Local repo key (default: owner-repo)")
@@ -3075,16 +3376,7 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Register/clone repo without ingesting",
     )
-    p_repo_add.add_argument(
-        "--reset-code-collection",
-        action="store_true",
-        help="Purge target code collection before ingesting",
-    )
-    p_repo_add.add_argument(
-        "--reset-manuals-collection",
-        action="store_true",
-        help="Purge target manuals collection before ingesting manuals",
-    )
+    _add_reset_collection_args(p_repo_add, before="ingesting")
     p_repo_add.add_argument(
         "--generate-manuals",
         action="store_true",
@@ -3100,9 +3392,12 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Overwrite existing registry entry for this repo key",
     )
-    p_repo_add.add_argument("--json", action="store_true", help="Output raw JSON")
+    _add_json_arg(p_repo_add)
     p_repo_add.set_defaults(func=cmd_repo_add)
 
+
+def _build_repo_add_lazy_parser(repo_sub: argparse._SubParsersAction) -> None:
+    """Register the `repo add-lazy` subcommand."""
     p_repo_add_lazy = repo_sub.add_parser(
         "add-lazy",
         help="⚡ Lazy-onboard a GitHub repo (file tree only, ~2-5s, content embedded on-demand)",
@@ -3119,9 +3414,12 @@ def build_parser() -> argparse.ArgumentParser:
     p_repo_add_lazy.add_argument(
         "--force", action="store_true", help="Overwrite existing registry entry"
     )
-    p_repo_add_lazy.add_argument("--json", action="store_true", help="Output raw JSON")
+    _add_json_arg(p_repo_add_lazy)
     p_repo_add_lazy.set_defaults(func=cmd_repo_add_lazy)
 
+
+def _build_repo_sync_parser(repo_sub: argparse._SubParsersAction) -> None:
+    """Register the `repo sync` subcommand."""
     p_repo_sync = repo_sub.add_parser("sync", help="Pull and refresh registered repositories")
     p_repo_sync.add_argument("name", nargs="?", help="Repo key from registry")
     p_repo_sync.add_argument("--all", action="store_true", help="Sync all repositories")
@@ -3131,16 +3429,7 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Update git clone but skip ingest",
     )
-    p_repo_sync.add_argument(
-        "--reset-code-collection",
-        action="store_true",
-        help="Purge target code collection before ingesting",
-    )
-    p_repo_sync.add_argument(
-        "--reset-manuals-collection",
-        action="store_true",
-        help="Purge target manuals collection before ingesting manuals",
-    )
+    _add_reset_collection_args(p_repo_sync, before="ingesting")
     p_repo_sync.add_argument(
         "--generate-manuals",
         action="store_true",
@@ -3151,9 +3440,12 @@ def build_parser() -> argparse.ArgumentParser:
         help="Collection for generated manuals (default: stored value or <collection>_manuals)",
     )
     p_repo_sync.add_argument("--manuals-output", help="Manuals output directory")
-    p_repo_sync.add_argument("--json", action="store_true", help="Output raw JSON")
+    _add_json_arg(p_repo_sync)
     p_repo_sync.set_defaults(func=cmd_repo_sync)
 
+
+def _build_repo_migrate_collections_parser(repo_sub: argparse._SubParsersAction) -> None:
+    """Register the `repo migrate-collections` subcommand."""
     p_repo_migrate = repo_sub.add_parser(
         "migrate-collections",
         help="Split existing tracked repos into <collection>_code and <collection>_manuals",
@@ -3183,41 +3475,114 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Delete old collection documents/chunks after successful migration",
     )
-    p_repo_migrate.add_argument(
-        "--reset-code-collection",
-        action="store_true",
-        help="Purge target code collection before reindexing",
-    )
-    p_repo_migrate.add_argument(
-        "--reset-manuals-collection",
-        action="store_true",
-        help="Purge target manuals collection before reindexing manuals",
-    )
+    _add_reset_collection_args(p_repo_migrate, before="reindexing")
     p_repo_migrate.add_argument(
         "--apply",
         action="store_true",
         help="Execute migration (default is dry-run)",
     )
-    p_repo_migrate.add_argument("--json", action="store_true", help="Output raw JSON")
+    _add_json_arg(p_repo_migrate)
     p_repo_migrate.set_defaults(func=cmd_repo_migrate_collections)
 
+
+def _build_repo_list_parser(repo_sub: argparse._SubParsersAction) -> None:
+    """Register the `repo list` subcommand."""
     p_repo_list = repo_sub.add_parser("list", help="List registered repositories")
-    p_repo_list.add_argument("--json", action="store_true", help="Output raw JSON")
+    _add_json_arg(p_repo_list)
     p_repo_list.set_defaults(func=cmd_repo_list)
 
+
+def _build_repo_parser(sub: argparse._SubParsersAction) -> None:
+    """Register the `repo` subcommand."""
+    p_repo = sub.add_parser("repo", help=_COMMAND_HELP["repo"])
+    repo_sub = p_repo.add_subparsers(dest="repo_command", help="Repo commands")
+    repo_sub.required = True
+
+    _build_repo_add_parser(repo_sub)
+    _build_repo_add_lazy_parser(repo_sub)
+    _build_repo_sync_parser(repo_sub)
+    _build_repo_migrate_collections_parser(repo_sub)
+    _build_repo_list_parser(repo_sub)
+
+
+_COMMAND_BUILDERS: dict[str, Callable[[argparse._SubParsersAction], None]] = {
+    "init": _build_init_parser,
+    "ingest": _build_ingest_parser,
+    "scan": _build_scan_parser,
+    "query": _build_query_parser,
+    "chat": _build_chat_parser,
+    "feedback": _build_feedback_parser,
+    "eval": _build_eval_parser,
+    "generate-docs": _build_generate_docs_parser,
+    "generate-manuals": _build_generate_manuals_parser,
+    "config": _build_config_parser,
+    "providers": _build_providers_parser,
+    "migrate-embedding-dimension": _build_migrate_embedding_dimension_parser,
+    "repo": _build_repo_parser,
+}
+
+
+def _sniff_subcommand(argv: list[str]) -> str | None:
+    """Return the subcommand named in argv, or None when the full parser is needed."""
+    for arg in argv:
+        if not arg.startswith("-"):
+            return arg if arg in _COMMAND_BUILDERS else None
+        if arg in ("-h", "--help"):
+            return None
+    return None
+
+
+def _new_parser() -> tuple[argparse.ArgumentParser, argparse._SubParsersAction]:
+    """Create the top-level parser and its (empty) subcommand group."""
+    parser = argparse.ArgumentParser(
+        prog="ragops",
+        description="RAG Ops — Query any codebase with AI",
+    )
+    parser.add_argument("--version", action="version", version=_VERSION)
+    sub = parser.add_subparsers(dest="command", help="Available commands")
+    return parser, sub
+
+
+def _build_index_parser() -> argparse.ArgumentParser:
+    """Build a parser listing every subcommand name without their arguments.
+
+    Enough for top-level help, usage and invalid-choice errors.
+    """
+    parser, sub = _new_parser()
+    for name, help_text in _COMMAND_HELP.items():
+        sub.add_parser(name, help=help_text)
+    return parser
+
+
+def build_parser(command: str | None = None) -> argparse.ArgumentParser:
+    """Build the ragops CLI argument parser.
+
+    When ``command`` names a known subcommand, only that subparser is registered.
+    """
+    parser, sub = _new_parser()
+    if command in _COMMAND_BUILDERS:
+        _COMMAND_BUILDERS[command](sub)
+    else:
+        for build in _COMMAND_BUILDERS.values():
+            build(sub)
     return parser
 
 
 def main() -> None:
     """CLI entrypoint."""
-    _apply_user_profile_defaults()
-    parser = build_parser()
-    args = parser.parse_args()
+    argv = sys.argv[1:]
+    if argv == ["--version"]:
+        print(_VERSION)
+        return
+    command = _sniff_subcommand(argv)
+    parser = build_parser(command) if command else _build_index_parser()
+    args = parser.parse_args(argv)
 
     if not args.command:
         parser.print_help()
         sys.exit(0)
 
+    _apply_user_profile_defaults()
     args.func(args)
 
 
@@ -3,12 +3,14 @@
 from __future__ import annotations
 
 import json
+import os
+import re
+import shutil
+import uuid
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
-import yaml
-
 CONFIG_DIR = ".ragops"
 CONFIG_FILE = "config.yaml"
 
@@ -22,6 +24,7 @@ PROJECT_MARKERS = [
     "build.gradle",
     ".git",
 ]
+_PROJECT_MARKER_SET = frozenset(PROJECT_MARKERS)
 
 DEFAULT_IGNORE = [
     "__pycache__",
@@ -41,49 +44,59 @@ DEFAULT_IGNORE = [
 ]
 
 # File extensions supported for ingestion
-CODE_EXTENSIONS = {
-    ".py",
-    ".js",
-    ".ts",
-    ".tsx",
-    ".jsx",
-    ".go",
-    ".rs",
-    ".java",
-    ".kt",
-    ".rb",
-    ".php",
-    ".swift",
-    ".c",
-    ".cpp",
-    ".h",
-    ".cs",
-    ".scala",
-}
-
-DOC_EXTENSIONS = {
-    ".md",
-    ".txt",
-    ".rst",
-    ".adoc",
-    ".yaml",
-    ".yml",
-    ".json",
-    ".toml",
-}
+CODE_EXTENSIONS = frozenset(
+    {
+        ".py",
+        ".js",
+        ".ts",
+        ".tsx",
+        ".jsx",
+        ".go",
+        ".rs",
+        ".java",
+        ".kt",
+        ".rb",
+        ".php",
+        ".swift",
+        ".c",
+        ".cpp",
+        ".h",
+        ".cs",
+        ".scala",
+    }
+)
+
+DOC_EXTENSIONS = frozenset(
+    {
+        ".md",
+        ".txt",
+        ".rst",
+        ".adoc",
+        ".yaml",
+        ".yml",
+        ".json",
+        ".toml",
+    }
+)
 
 ALL_EXTENSIONS = CODE_EXTENSIONS | DOC_EXTENSIONS
 
+# Sorted once here so each ProjectConfig only copies the defaults.
+_DEFAULT_EXTENSIONS = tuple(sorted(ALL_EXTENSIONS))
+_DEFAULT_IGNORE = tuple(DEFAULT_IGNORE)
+
+_PACKAGE_JSON_NAME = re.compile(rb'\s*\{\s*"name"\s*:\s*"([^"\\]+)"\s*[,}]')
 
-@dataclass
+
+@dataclass(slots=True)
 class ProjectConfig:
     """Configuration for a ragops project."""
 
     name: str = ""
     doc_dirs: list[str] = field(default_factory=lambda: ["docs", "."])
     code_dirs: list[str] = field(default_factory=lambda: ["."])
-    ignore_patterns: list[str] = field(default_factory=lambda: list(DEFAULT_IGNORE))
-    extensions: list[str] = field(default_factory=lambda: sorted(ALL_EXTENSIONS))
+    ignore_patterns: list[str] = field(default_factory=lambda: list(_DEFAULT_IGNORE))
+    extensions: list[str] = field(default_factory=lambda: list(_DEFAULT_EXTENSIONS))
     embedding_model: str = "text-embedding-3-small"
     chunk_size: int = 512
     chunk_overlap: int = 64
@@ -106,22 +119,54 @@ class ProjectConfig:
             name=data.get("name", ""),
             doc_dirs=data.get("doc_dirs", ["docs", "."]),
             code_dirs=data.get("code_dirs", ["."]),
-            ignore_patterns=data.get("ignore_patterns", list(DEFAULT_IGNORE)),
-            extensions=data.get("extensions", sorted(ALL_EXTENSIONS)),
+            ignore_patterns=data.get("ignore_patterns", list(_DEFAULT_IGNORE)),
+            extensions=data.get("extensions", list(_DEFAULT_EXTENSIONS)),
             embedding_model=data.get("embedding_model", "text-embedding-3-small"),
             chunk_size=data.get("chunk_size", 512),
             chunk_overlap=data.get("chunk_overlap", 64),
         )
 
 
+def atomic_write_text(path: Path, text: str) -> Path:
+    """Replace a file's contents atomically, keeping symlinks and the file mode.
+
+    The text goes to a sibling temp file that is fsynced and then swapped in with
+    ``os.replace``, so a crash never leaves a truncated file. A symlinked path is
+    written through to its target. An existing file keeps its mode; a new one gets
+    the usual ``0o666 & ~umask``, like a plain ``open(path, "w")``.
+    """
+    target = path.resolve()
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp = target.with_name(f".{target.name}.{uuid.uuid4().hex[:8]}.tmp")
+    # os.open applies the umask to 0o666; mkstemp would force 0o600.
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            handle.write(text)
+            handle.flush()
+            os.fsync(handle.fileno())
+        if target.exists():
+            shutil.copymode(target, tmp)
+        os.replace(tmp, target)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    return path
+
+
 def find_project_root(start: Path | None = None) -> Path | None:
     """Walk up from start to find a directory with a project marker."""
-    current = (start or Path.cwd()).resolve()
+    # Walk plain strings; only the match is turned back into a Path.
+    current = os.path.realpath(start if start is not None else os.getcwd())
     for _ in range(20):  # safety limit
-        for marker in PROJECT_MARKERS:
-            if (current / marker).exists():
-                return current
-        parent = current.parent
+        # One directory listing per level instead of a stat per marker.
+        try:
+            with os.scandir(current) as entries:
+                if any(entry.name in _PROJECT_MARKER_SET for entry in entries):
+                    return Path(current)
+        except OSError:
+            pass
+        parent = os.path.dirname(current)
         if parent == current:
             break
         current = parent
@@ -148,8 +193,11 @@ def detect_project_name(root: Path) -> str:
     pkg_json = root / "package.json"
     if pkg_json.exists():
         try:
-            with open(pkg_json) as f:
-                data = json.load(f)
+            with open(pkg_json, "rb") as f:
+                head = f.read(4096)
+                # "name" is conventionally the first key; only parse everything if it isn't.
+                match = _PACKAGE_JSON_NAME.match(head)
+                data = {"name": match.group(1).decode()} if match else json.loads(head + f.read())
             name = data.get("name", "")
             if name:
                 return name
@@ -172,12 +220,14 @@ def detect_project_name(root: Path) -> str:
 
 def load_config(project_dir: Path | None = None) -> ProjectConfig:
     """Load project config from .ragops/config.yaml."""
+    import yaml
+
     root = project_dir or find_project_root() or Path.cwd()
     config_path = root / CONFIG_DIR / CONFIG_FILE
 
     if config_path.exists():
         with open(config_path) as f:
-            data = yaml.safe_load(f) or {}
+            data = yaml.load(f, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader)) or {}
         return ProjectConfig.from_dict(data)
 
     # Return defaults with detected name
@@ -186,6 +236,8 @@ def load_config(project_dir: Path | None = None) -> ProjectConfig:
 
 def save_config(config: ProjectConfig, project_dir: Path) -> Path:
     """Save project config to .ragops/config.yaml."""
+    import yaml
+
     config_dir = project_dir / CONFIG_DIR
     config_dir.mkdir(exist_ok=True)
 
@@ -202,8 +254,11 @@ def save_config(config: ProjectConfig, project_dir: Path) -> Path:
     # Add .ragops/ to gitignore if not present
     gitignore = project_dir / ".gitignore"
     if gitignore.exists():
-        content = gitignore.read_text()
-        if ".ragops/" not in content:
+        # Stop at the first match instead of reading the whole file into memory; only
+        # reopen for writing when the entry is missing (.gitignore may be read-only).
+        with open(gitignore) as f:
+            listed = any(".ragops/" in line for line in f)
+        if not listed:
             with open(gitignore, "a") as f:
                 f.write("\n# RAG Ops\n.ragops/\n")
     else:
@@ -7,6 +7,18 @@ import httpx
 from services.api.app.chat import ChatResult
 from services.api.app.retriever import QueryResult
 
+try:
+    import orjson
+except ImportError:  # optional: pip install "ragops[fast]"
+    orjson = None  # type: ignore[assignment]
+
+
+def _response_json(resp: httpx.Response) -> Any:
+    """Decode a JSON response body, via orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(resp.content)
+    return resp.json()
+
 
 def _query_remote(question: str, url: str, collection: str) -> Any:
     """Query a remote API and return a QueryResult-like object."""
@@ -21,7 +33,7 @@ def _query_remote(question: str, url: str, collection: str) -> Any:
             timeout=30.0,
         )
         resp.raise_for_status()
-        data = resp.json()
+        data = _response_json(resp)
 
         return QueryResult(
             answer=data.get("answer", ""),
@@ -61,7 +73,7 @@ def _query_remote_with_auth(
             timeout=30.0,
         )
         resp.raise_for_status()
-        data = resp.json()
+        data = _response_json(resp)
         return QueryResult(
             answer=data.get("answer", ""),
             citations=data.get("citations", []),
@@ -92,8 +104,12 @@ def _chat_remote(
     include_context: bool = False,
     include_ranking_signals: bool = False,
     api_key: str | None = None,
+    client: httpx.Client | None = None,
 ) -> Any:
-    """Query remote chat endpoint and return a ChatResult-like object."""
+    """Query remote chat endpoint and return a ChatResult-like object.
+
+    Pass a shared ``client`` to reuse keep-alive connections across turns.
+    """
     if not url.endswith("/v1/chat"):
         url = url.rstrip("/") + "/v1/chat"
 
@@ -111,9 +127,10 @@ def _chat_remote(
 
     try:
         headers = {"x-api-key": api_key} if api_key else None
-        resp = httpx.post(url, json=payload, headers=headers, timeout=30.0)
+        post = client.post if client is not None else httpx.post
+        resp = post(url, json=payload, headers=headers, timeout=30.0)
         resp.raise_for_status()
-        data = resp.json()
+        data = _response_json(resp)
 
         return ChatResult(
             session_id=data.get("session_id", session_id or ""),
@@ -147,4 +164,4 @@ def _feedback_remote(
     headers = {"x-api-key": api_key} if api_key else None
     resp = httpx.post(url, json=payload, headers=headers, timeout=30.0)
     resp.raise_for_status()
-    return resp.json()
+    return _response_json(resp)
@@ -10,10 +10,12 @@ from urllib.parse import quote, urlparse, urlunparse
 
 import yaml
 
+from services.cli.project import atomic_write_text
+
 REGISTRY_FILE = "repos.yaml"
 
 
-@dataclass
+@dataclass(slots=True)
 class RepoRecord:
     """Tracked repository metadata."""
 
@@ -80,7 +82,7 @@ def load_repo_registry(project_root: Path) -> dict[str, RepoRecord]:
     path = registry_path(project_root)
     if not path.exists():
         return {}
-    data = yaml.safe_load(path.read_text()) or {}
+    data = yaml.load(path.read_text(), Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader)) or {}
     rows = data.get("repos", [])
     records: dict[str, RepoRecord] = {}
     if isinstance(rows, list):
@@ -93,11 +95,14 @@ def load_repo_registry(project_root: Path) -> dict[str, RepoRecord]:
 
 
 def save_repo_registry(project_root: Path, records: dict[str, RepoRecord]) -> Path:
-    """Persist repo registry to disk."""
+    """Persist repo registry to disk.
+
+    Written atomically, so a crash mid-write never leaves a truncated registry behind.
+    """
     path = registry_path(project_root)
     path.parent.mkdir(parents=True, exist_ok=True)
     payload = {"repos": [records[name].to_dict() for name in sorted(records)]}
-    path.write_text(yaml.safe_dump(payload, sort_keys=False))
+    atomic_write_text(path, yaml.safe_dump(payload, sort_keys=False))
     return path
 
 
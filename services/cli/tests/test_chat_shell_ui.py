@@ -5,7 +5,11 @@ from __future__ import annotations
 from pathlib import Path
 from types import SimpleNamespace
 
+from rich.markdown import Markdown
+from rich.text import Text
+
 from services.cli.main import (
+    _chat_text,
     _citation_signal_summary,
     _citation_summary,
     _format_chat_provider_label,
@@ -20,6 +24,13 @@ def test_parse_chat_shell_command_variants() -> None:
     assert _parse_chat_shell_command("what is this") == ("", "")
 
 
+def test_chat_text_only_parses_markdown_when_needed() -> None:
+    assert isinstance(_chat_text("The config lives in settings.py."), Text)
+    assert isinstance(_chat_text("See `config.py` for **details**."), Markdown)
+    assert isinstance(_chat_text("- first\n- second"), Markdown)
+    assert isinstance(_chat_text("1. step one"), Markdown)
+
+
 def test_format_chat_provider_label_remote() -> None:
     settings = SimpleNamespace(llm_enabled=True, llm_provider="openai")
     label = _format_chat_provider_label(settings, "https://api.example.com/v1/chat")
@@ -1,4 +1,4 @@
-"""Tests for `ragops config` command handlers."""
+"""Tests for `ragops config` and other CLI command handlers."""
 
 from __future__ import annotations
 
@@ -6,7 +6,16 @@ import argparse
 import json
 from pathlib import Path
 
-from services.cli.main import cmd_config_doctor, cmd_config_set, cmd_config_show
+import pytest
+
+from services.cli.main import (
+    _repo_ingest_and_manuals,
+    _upsert_env_values,
+    cmd_config_doctor,
+    cmd_config_set,
+    cmd_config_show,
+    cmd_providers,
+)
 
 
 def test_cmd_config_set_and_show_json(tmp_path: Path, monkeypatch, capsys) -> None:
@@ -118,3 +127,101 @@ def test_cmd_config_doctor_fix_writes_missing_project_env(
     assert "OPENAI_API_KEY=sk-global-112233" in env_content
     assert payload["fix"]["requested"] is True
     assert any(item.startswith("STORAGE_BACKEND=") for item in payload["fix"]["applied"])
+
+
+def test_upsert_env_values_replaces_atomically_and_keeps_mode(tmp_path: Path) -> None:
+    env_path = tmp_path / ".env"
+    env_path.write_text("# keep\nA=1\nB=2\n", encoding="utf-8")
+    env_path.chmod(0o640)
+
+    _upsert_env_values(env_path, {"B": "3", "C": "4"})
+
+    assert env_path.read_text(encoding="utf-8") == "# keep\nA=1\nB=3\nC=4\n"
+    assert env_path.stat().st_mode & 0o777 == 0o640
+    assert [p.name for p in tmp_path.iterdir()] == [".env"]
+
+
+def test_upsert_env_values_writes_through_symlinked_env(tmp_path: Path) -> None:
+    shared = tmp_path / "shared"
+    shared.mkdir()
+    real_env = shared / "app.env"
+    real_env.write_text("A=1\n", encoding="utf-8")
+    env_path = tmp_path / ".env"
+    env_path.symlink_to(real_env)
+
+    _upsert_env_values(env_path, {"A": "2"})
+
+    assert env_path.is_symlink()
+    assert real_env.read_text(encoding="utf-8") == "A=2\n"
+
+
+def test_repo_manuals_survive_failed_manual_generation(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    import services.cli.docgen.manuals as manuals
+    import services.core.storage as storage
+    import services.ingest.app.pipeline as pipeline
+
+    events: list[str] = []
+
+    class FakeConn:
+        def close(self) -> None:
+            events.append("close")
+
+    class FailingGenerator:
+        def __init__(self, repo_dir: Path) -> None:
+            pass
+
+        def generate(self, **_: object) -> None:
+            raise RuntimeError("manuals failed")
+
+    monkeypatch.setattr(storage, "get_connection", lambda settings: FakeConn())
+    monkeypatch.setattr(
+        storage,
+        "purge_collection_documents",
+        lambda conn, *, collection: events.append(f"purge:{collection}"),
+    )
+    monkeypatch.setattr(
+        pipeline,
+        "ingest_local_directory",
+        lambda **kwargs: events.append(f"ingest:{kwargs['collection']}"),
+    )
+    monkeypatch.setattr(manuals, "ManualPackGenerator", FailingGenerator)
+
+    with pytest.raises(RuntimeError, match="manuals failed"):
+        _repo_ingest_and_manuals(
+            repo_dir=tmp_path,
+            collection="demo",
+            project_root=tmp_path,
+            settings=object(),
+            skip_ingest=False,
+            generate_manuals=True,
+            manuals_collection=None,
+            manuals_output=str(tmp_path / "out"),
+            reset_code_collection=True,
+            reset_manuals_collection=True,
+            provider=object(),
+        )
+
+    assert events == ["purge:demo", "ingest:demo", "close"]
+
+
+def test_cmd_providers_prints_tab_separated_rows_when_piped(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("LLM_PROVIDER", "groq")
+    monkeypatch.setenv("EMBEDDING_PROVIDER", "ollama")
+
+    cmd_providers(argparse.Namespace())
+
+    rows = [line.split("\t") for line in capsys.readouterr().out.splitlines()]
+    assert rows
+    assert all(len(row) == 6 for row in rows)
+    active = {row[0]: row[5] for row in rows}
+    assert active["groq"] == "LLM"
+    assert active["ollama"] == "Embed"
+    assert active["openai"] == "-"
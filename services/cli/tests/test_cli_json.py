@@ -0,0 +1,36 @@
+"""Tests for CLI JSON serialization helpers."""
+
+from __future__ import annotations
+
+import io
+import json
+import sys
+
+from services.cli import main
+
+
+def test_json_bytes_stdlib_fallback_matches_orjson_layout(monkeypatch) -> None:
+    payload = {"summary": {"total_cases": 2, "label": "café"}, "cases": [1, 2]}
+    monkeypatch.setattr(main, "orjson", None)
+
+    encoded = main._json_bytes(payload)
+
+    assert json.loads(encoded) == payload
+    assert encoded.decode("utf-8") == json.dumps(payload, indent=2, ensure_ascii=False)
+
+
+def test_print_json_writes_bytes_and_falls_back_to_text_streams(monkeypatch, capsys) -> None:
+    main._print_json({"status": "ok"})
+    assert json.loads(capsys.readouterr().out) == {"status": "ok"}
+
+    stream = io.StringIO()
+    monkeypatch.setattr(sys, "stdout", stream)
+    main._print_json({"status": "ok"})
+    assert stream.getvalue() == '{\n  "status": "ok"\n}\n'
+
+
+def test_json_loads_accepts_the_same_input_with_and_without_orjson(monkeypatch) -> None:
+    raw = '[{"source": "café.md", "line_start": 1}]'
+    parsed = main._json_loads(raw)
+    monkeypatch.setattr(main, "orjson", None)
+    assert main._json_loads(raw) == parsed == [{"source": "café.md", "line_start": 1}]
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from services.cli.main import build_parser
+from services.cli.main import _build_index_parser, _sniff_subcommand, build_parser
 
 
 def test_chat_parser_allows_interactive_mode_without_question() -> None:
@@ -104,3 +104,17 @@ def test_config_doctor_parser_fix_flag() -> None:
     parser = build_parser()
     args = parser.parse_args(["config", "doctor", "--fix"])
     assert args.fix is True
+
+
+def test_sniffed_subcommand_builds_only_that_parser() -> None:
+    command = _sniff_subcommand(["repo", "sync", "--all"])
+    assert command == "repo"
+    args = build_parser(command).parse_args(["repo", "sync", "--all"])
+    assert args.repo_command == "sync"
+    assert args.all is True
+    assert _sniff_subcommand(["--help"]) is None
+    assert _sniff_subcommand(["bogus"]) is None
+
+
+def test_index_parser_help_matches_full_parser() -> None:
+    assert _build_index_parser().format_help() == build_parser().format_help()
@@ -7,6 +7,7 @@ from pathlib import Path
 
 import pytest
 
+from services.cli.docgen.analyzer import Analyzer
 from services.cli.docgen.manuals import ManualPackGenerator
 from services.core.config import Settings
 
@@ -129,3 +130,36 @@ def test_generate_manual_pack_with_db_error(
     assert result.db_error == "db unavailable in test"
     db_manual = (output_dir / "DATABASE_MANUAL.md").read_text(encoding="utf-8")
     assert "Database introspection failed" in db_manual
+
+
+def test_analyzer_skips_excluded_paths(tmp_path: Path) -> None:
+    _seed_project(tmp_path)
+    (tmp_path / "docs").mkdir()
+    (tmp_path / "docs" / "README.md").write_text("# generated\n", encoding="utf-8")
+    (tmp_path / "docs" / "guide.md").write_text("# hand-written\n", encoding="utf-8")
+    (tmp_path / ".ragops").mkdir()
+    (tmp_path / ".ragops" / "config.yaml").write_text("name: demo\n", encoding="utf-8")
+    excluded = [tmp_path / "docs" / "README.md", tmp_path / ".ragops"]
+
+    ctx = Analyzer(tmp_path, exclude_paths=excluded).analyze()
+
+    assert "docs/README.md" not in ctx.file_tree
+    assert "docs/guide.md" in ctx.file_tree
+    assert not any(path.startswith(".ragops") for path in ctx.file_tree)
+    assert repr(ctx) == repr(Analyzer(tmp_path, exclude_paths=excluded).analyze())
+
+
+def test_docgen_cache_entry_is_published_only_when_complete(tmp_path: Path) -> None:
+    from services.cli.main import _store_docgen_cache
+
+    cache_dir = tmp_path / "docgen" / "abc"
+    partial = {"README.md": "# readme", "ARCHITECTURE.md": "# arch", "API.md": None}
+
+    with pytest.raises(TypeError):
+        _store_docgen_cache(cache_dir, partial)  # type: ignore[arg-type]
+    assert not cache_dir.exists()
+    assert list((tmp_path / "docgen").iterdir()) == []
+
+    _store_docgen_cache(cache_dir, {**partial, "API.md": "# api"})
+    _store_docgen_cache(cache_dir, {**partial, "API.md": "# api v2"})
+    assert (cache_dir / "API.md").read_text(encoding="utf-8") == "# api v2"
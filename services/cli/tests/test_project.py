@@ -0,0 +1,44 @@
+"""Tests for project detection helpers."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from services.cli.project import ProjectConfig, detect_project_name, save_config
+
+
+def test_detect_project_name_reads_leading_and_nested_package_json_names(tmp_path: Path) -> None:
+    (tmp_path / "package.json").write_text(
+        json.dumps({"name": "web-app", "version": "1.0.0"}, indent=2),
+        encoding="utf-8",
+    )
+    assert detect_project_name(tmp_path) == "web-app"
+
+    (tmp_path / "package.json").write_text(
+        json.dumps({"author": {"name": "someone"}, "name": "late-name"}),
+        encoding="utf-8",
+    )
+    assert detect_project_name(tmp_path) == "late-name"
+
+
+def test_save_config_adds_ragops_to_gitignore_once(tmp_path: Path) -> None:
+    gitignore = tmp_path / ".gitignore"
+    gitignore.write_text("node_modules/\n", encoding="utf-8")
+
+    save_config(ProjectConfig(name="demo"), tmp_path)
+    save_config(ProjectConfig(name="demo"), tmp_path)
+
+    assert gitignore.read_text(encoding="utf-8") == "node_modules/\n\n# RAG Ops\n.ragops/\n"
+
+
+def test_save_config_leaves_read_only_gitignore_alone_when_listed(tmp_path: Path) -> None:
+    gitignore = tmp_path / ".gitignore"
+    gitignore.write_text(".ragops/\n", encoding="utf-8")
+    gitignore.chmod(0o444)
+    try:
+        save_config(ProjectConfig(name="demo"), tmp_path)
+    finally:
+        gitignore.chmod(0o644)
+
+    assert gitignore.read_text(encoding="utf-8") == ".ragops/\n"
@@ -0,0 +1,33 @@
+"""Tests for remote API helpers used by the CLI."""
+
+from __future__ import annotations
+
+import httpx
+
+from services.cli.remote import _chat_remote
+
+
+def test_chat_remote_reuses_provided_client() -> None:
+    seen: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(str(request.url))
+        return httpx.Response(
+            200,
+            json={"session_id": "s1", "answer": "ok", "turn_index": len(seen)},
+        )
+
+    with httpx.Client(transport=httpx.MockTransport(handler)) as client:
+        first = _chat_remote("q1", "https://api.example.com", "demo", client=client)
+        second = _chat_remote(
+            "q2",
+            "https://api.example.com",
+            "demo",
+            session_id=first.session_id,
+            client=client,
+        )
+
+    assert seen == ["https://api.example.com/v1/chat", "https://api.example.com/v1/chat"]
+    assert first.answer == "ok"
+    assert second.session_id == "s1"
+    assert second.turn_index == 2
@@ -1,5 +1,6 @@
 """Tests for repository helper utilities."""
 
+import os
 from pathlib import Path
 
 import pytest
@@ -92,6 +93,26 @@ def test_repo_registry_round_trip(tmp_path: Path) -> None:
     assert loaded_record.manuals_collection == "openai-openai-python_manuals"
 
 
+def test_save_repo_registry_replaces_file_without_leftovers(tmp_path: Path) -> None:
+    record = RepoRecord(
+        name="demo",
+        url="https://github.com/o/demo.git",
+        collection="demo",
+        local_path="x",
+    )
+    old_umask = os.umask(0o027)
+    try:
+        save_repo_registry(tmp_path, {})
+    finally:
+        os.umask(old_umask)
+    path = save_repo_registry(tmp_path, {"demo": record})
+
+    assert load_repo_registry(tmp_path)["demo"] == record
+    assert [p.name for p in path.parent.iterdir()] == [path.name]
+    # A new registry honours the umask; a rewrite keeps whatever mode the file has.
+    assert path.stat().st_mode & 0o777 == 0o640
+
+
 def test_parse_github_repo_url_empty_raises() -> None:
     with pytest.raises(ValueError, match="required"):
         parse_github_repo_url("")
@@ -105,4 +126,3 @@ def test_parse_github_repo_url_non_github_raises() -> None:
 def test_parse_github_repo_url_missing_repo_name_raises() -> None:
     with pytest.raises(ValueError, match="owner and repository"):
         parse_github_repo_url("https://github.com/only-owner")
-
@@ -6,8 +6,6 @@ from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
-import yaml
-
 USER_CONFIG_DIR = ".ragops"
 USER_CONFIG_FILE = "config.yaml"
 
@@ -23,8 +21,11 @@ def load_user_config(home: Path | None = None) -> dict[str, Any]:
     path = user_config_path(home)
     if not path.exists():
         return {}
+    import yaml
+
     try:
-        raw = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        raw = yaml.load(path.read_text(encoding="utf-8"), Loader=loader) or {}
         return raw if isinstance(raw, dict) else {}
     except Exception:
         return {}
@@ -32,6 +33,8 @@ def load_user_config(home: Path | None = None) -> dict[str, Any]:
 
 def save_user_config(values: dict[str, Any], home: Path | None = None) -> Path:
     """Merge and persist user-level config."""
+    import yaml
+
     path = user_config_path(home)
     path.parent.mkdir(parents=True, exist_ok=True)
     payload = load_user_config(home)
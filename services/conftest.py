@@ -0,0 +1,17 @@
+"""Shared pytest fixtures for all service test suites."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+
+import pytest
+
+from services.core.config import get_settings
+
+
+@pytest.fixture(autouse=True)
+def _fresh_settings() -> Iterator[None]:
+    """Drop the cached Settings so each test sees its own env and .env file."""
+    get_settings.cache_clear()
+    yield
+    get_settings.cache_clear()
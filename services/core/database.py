@@ -310,8 +310,6 @@ def upsert_document(
     metadata: dict[str, Any] | None = None,
 ) -> int:
     """Insert or update a document record. Returns the document id."""
-    import json
-
     meta_json = json.dumps(metadata or {})
     row = conn.execute(
         """
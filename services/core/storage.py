@@ -74,11 +74,17 @@ def _is_sqlite(conn: Any) -> bool:
     return isinstance(conn, sqlite3.Connection)
 
 
+# Stored in PRAGMA user_version once the schema script has run on a database file.
+# Bump it whenever the script below changes so existing databases pick up the change.
+SQLITE_SCHEMA_VERSION = 1
+
+
 def _ensure_sqlite_schema(conn: sqlite3.Connection) -> None:
+    conn.execute("PRAGMA foreign_keys = ON")
+    if conn.execute("PRAGMA user_version").fetchone()[0] >= SQLITE_SCHEMA_VERSION:
+        return
     conn.executescript(
         """
-        PRAGMA foreign_keys = ON;
-
         CREATE TABLE IF NOT EXISTS ragops_meta (
             key TEXT PRIMARY KEY,
             value TEXT NOT NULL
@@ -180,6 +186,7 @@ def _ensure_sqlite_schema(conn: sqlite3.Connection) -> None:
         CREATE INDEX IF NOT EXISTS idx_repo_files_embedded ON repo_files (collection, embedded);
         """
     )
+    conn.execute(f"PRAGMA user_version = {SQLITE_SCHEMA_VERSION}")
     conn.commit()
 
 
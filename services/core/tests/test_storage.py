@@ -6,6 +6,7 @@ from pathlib import Path
 
 from services.core.config import Settings
 from services.core.storage import (
+    SQLITE_SCHEMA_VERSION,
     build_index_version,
     count_chat_turns,
     document_exists_for_index,
@@ -251,3 +252,23 @@ def test_sqlite_migrate_embedding_dimension_clears_vectors(tmp_path: Path) -> No
     assert int(result["chunks_deleted"]) == 1
     assert int(docs_after) == 0
     assert int(chunks_after) == 0
+
+
+def test_sqlite_schema_script_runs_once_per_database(tmp_path: Path) -> None:
+    settings = _sqlite_settings(tmp_path / "ragops.db")
+    conn = get_connection(settings)
+    try:
+        assert conn.execute("PRAGMA user_version").fetchone()[0] == SQLITE_SCHEMA_VERSION
+        conn.execute("DROP TABLE repo_files")
+        conn.commit()
+        ensure_feedback_table(conn)
+        assert conn.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+        tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master")}
+        assert "repo_files" not in tables
+
+        conn.execute("PRAGMA user_version = 0")
+        ensure_feedback_table(conn)
+        tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master")}
+        assert "repo_files" in tables
+    finally:
+        conn.close()